@@ -40,7 +40,7 @@ from services.notification_service import NotificationService
 
 from infrastructure.content_plan_scheduler import ContentPlanScheduler, start_scheduler, stop_scheduler
 
-from bot.main_router import router
+from bot.main_router import build_router
 
 
 logger = logging.getLogger(__name__)
@@ -175,7 +175,7 @@ async def bootstrap(bot: Bot, dispatcher: Dispatcher):
     """
 
     # Регистрация основного router
-    dispatcher.include_router(router)
+    dispatcher.include_router(build_router())
     await build_and_bind_services(bot, dispatcher)
 
 
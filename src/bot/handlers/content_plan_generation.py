@@ -6,6 +6,7 @@ from aiogram.types import Message, ReplyKeyboardRemove, CallbackQuery, InlineKey
 from aiogram.enums.parse_mode import ParseMode
 
 from bot import dispatcher
+from bot.inline_keyboards import BACK_TO_PREVIOUS_ROW, BACK_TO_PREVIOUS_CALLBACK_DATA
 from bot.states import ContentPlan as ContentPlanState
 from services.notification_service import NotificationService
 from services.text_generation import TextGenerationService
@@ -35,7 +36,7 @@ PUBLICATION_TIME_INTERVAL_KEYBOARD = InlineKeyboardMarkup(
         [InlineKeyboardButton(text="Неделя", callback_data=WEEK_PUBLICATION_TIME_PERIOD)],
         [InlineKeyboardButton(text="Месяц", callback_data=MONTH_PUBLICATION_TIME_PERIOD)],
         [InlineKeyboardButton(text="🖊️ Свой вариант", callback_data=CUSTOM_PUBLICATION_TIME_PERIOD)],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data="back_to_previous")]
+        BACK_TO_PREVIOUS_ROW
     ]
 )
 
@@ -59,7 +60,7 @@ PUBLICATION_FREQUENCY_KEYBOARD = InlineKeyboardMarkup(
             [InlineKeyboardButton(text="каждый день", callback_data=DAILY_PUBLICATION_FREQUENCY)],
             [InlineKeyboardButton(text="раз в два дня", callback_data=ONCE_PER_TWO_DAYS_PUBLICATION_FREQUENCY)],
             [InlineKeyboardButton(text="🖊️ Свой вариант", callback_data="frequency_custom")],
-            [InlineKeyboardButton(text="⬅️ Назад", callback_data="back_to_previous")]
+            BACK_TO_PREVIOUS_ROW
         ]
     )
 
@@ -322,7 +323,7 @@ async def skip_step_handler(callback: CallbackQuery, state: FSMContext):
         await generate_and_save_plan(callback.message, state, data)
 
 
-@content_plan_router.callback_query(F.data == "back_to_previous")
+@content_plan_router.callback_query(F.data == BACK_TO_PREVIOUS_CALLBACK_DATA)
 async def back_to_previous_handler(callback: CallbackQuery, state: FSMContext):
     """Возврат к предыдущему шагу или главное меню."""
     await callback.answer()
@@ -1,7 +1,9 @@
 import logging
+from functools import lru_cache
 from aiogram import Router, F
 from aiogram.enums import ParseMode
 from aiogram.types import CallbackQuery, Message, InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardRemove
+from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.context import FSMContext
 
 from services.content_plan_service import ContentPlanService
@@ -25,11 +27,28 @@ content_plan_menu_router = Router(name="content_plan_menu")
 VIEW_USER_CONTENT_PLANS_CALLBACK_DATA = "content_plan_view"
 CONTENT_PLAN_MENU_CALLBACK_DATA = "content_plan"
 CREATE_NEW_CONTENT_PLAN_CALLBACK_DATA = "content_plan_create"
+CREATE_NEW_CONTENT_PLAN_ROW = [InlineKeyboardButton(text="➕ Создать новый план", callback_data=CREATE_NEW_CONTENT_PLAN_CALLBACK_DATA)]
+
+
+class ManageContentPlanCallback(CallbackData, prefix="cpm"):
+    """Выбор контент-плана для управления."""
+    plan_id: int
+
+
+class ViewContentPlanItemCallback(CallbackData, prefix="cpv"):
+    """Просмотр элемента контент-плана."""
+    item_id: int
+
+
+class GenerateContentPlanItemCallback(CallbackData, prefix="cpg"):
+    """Генерация текста поста по элементу контент-плана."""
+    item_id: int
+
 
 CONTENT_PLAN_MENU_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
         [InlineKeyboardButton(text="📋 Посмотреть мои планы", callback_data=VIEW_USER_CONTENT_PLANS_CALLBACK_DATA)],
-        [InlineKeyboardButton(text="➕ Создать новый план", callback_data=CREATE_NEW_CONTENT_PLAN_CALLBACK_DATA)],
+        CREATE_NEW_CONTENT_PLAN_ROW,
         [InlineKeyboardButton(text="⬅️ Назад в главное меню", callback_data="content_plan_back")],
     ]
 )
@@ -38,7 +57,7 @@ CONTENT_PLAN_MENU_KEYBOARD = InlineKeyboardMarkup(
 CONTENT_PLAN_LIST_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
         # Кнопка создания нового плана
-        [InlineKeyboardButton(text="➕ Создать новый план", callback_data=CREATE_NEW_CONTENT_PLAN_CALLBACK_DATA)],
+        CREATE_NEW_CONTENT_PLAN_ROW,
         # Кнопка возврата
         [InlineKeyboardButton(text="⬅️ Назад в меню контент-планов", callback_data=CONTENT_PLAN_MENU_CALLBACK_DATA)],
         [InlineKeyboardButton(text="🏠 Главное меню", callback_data="content_plan_back")],
@@ -129,17 +148,18 @@ async def view_content_plans_handler(callback: CallbackQuery, state: FSMContext)
 
         text += "Выберите план для управления:"
 
-        list_keyboard = CONTENT_PLAN_LIST_KEYBOARD.model_copy(deep=True)
-
-        # FIXME: коллбэки не обрабатываются
-        for plan in plans:
-            button_text = f"{plan.plan_name}"
-            callback_data = f"content_plan_manage_{plan.id_}"
-            list_keyboard.inline_keyboard.insert(
-                0,
-                [InlineKeyboardButton(text=button_text, callback_data=callback_data)],
-            )
-
+        # Кнопки планов идут над общими строками CONTENT_PLAN_LIST_KEYBOARD.
+        # Общие строки переиспользуются как есть, без глубокого копирования
+        plan_rows = [
+            [InlineKeyboardButton(
+                text=f"{plan.plan_name}",
+                callback_data=ManageContentPlanCallback(plan_id=plan.id_).pack(),
+            )]
+            for plan in reversed(plans)
+        ]
+        list_keyboard = InlineKeyboardMarkup(
+            inline_keyboard=plan_rows + CONTENT_PLAN_LIST_KEYBOARD.inline_keyboard,
+        )
 
         await callback.message.answer(
             text=text,
@@ -182,16 +202,19 @@ async def done_handler(callback: CallbackQuery, state: FSMContext):
 
 # === ОБРАБОТЧИКИ УПРАВЛЕНИЯ ПЛАНОМ ===
 
-@content_plan_menu_router.callback_query(F.data.startswith("content_plan_manage_"))
-async def manage_specific_plan_handler(callback: CallbackQuery, state: FSMContext):
+@content_plan_menu_router.callback_query(ManageContentPlanCallback.filter())
+async def manage_specific_plan_handler(
+        callback: CallbackQuery,
+        callback_data: ManageContentPlanCallback,
+        state: FSMContext,
+):
     """
     Меню управления конкретным контент-планом.
     Показывает список постов (элементов плана).
     """
     await callback.answer()
 
-    # Извлекаем ID плана из callback_data
-    plan_id = int(callback.data.split("_")[-1])
+    plan_id = callback_data.plan_id
 
     content_plan_service: ContentPlanService = dispatcher["content_plan_service"]
     plan = await content_plan_service.get_plan_by_id(plan_id)
@@ -219,7 +242,7 @@ async def manage_specific_plan_handler(callback: CallbackQuery, state: FSMContex
         btn_text = f"{date_str} | {item.content_title[:20]}..."
 
         # callback для выбора конкретного поста
-        callback_data = f"cp_item_view_{item.id_}"
+        callback_data = ViewContentPlanItemCallback(item_id=item.id_).pack()
 
         keyboard.inline_keyboard.append(
             [InlineKeyboardButton(text=btn_text, callback_data=callback_data)]
@@ -237,14 +260,18 @@ async def manage_specific_plan_handler(callback: CallbackQuery, state: FSMContex
     )
 
 
-@content_plan_menu_router.callback_query(F.data.startswith("cp_item_view_"))
-async def view_plan_item_handler(callback: CallbackQuery, state: FSMContext):
+@content_plan_menu_router.callback_query(ViewContentPlanItemCallback.filter())
+async def view_plan_item_handler(
+        callback: CallbackQuery,
+        callback_data: ViewContentPlanItemCallback,
+        state: FSMContext,
+):
     """
     Просмотр деталей конкретного поста из плана и кнопка генерации.
     """
     await callback.answer()
 
-    item_id = int(callback.data.split("_")[-1])
+    item_id = callback_data.item_id
     content_plan_service: ContentPlanService = dispatcher["content_plan_service"]
 
     # Получаем элемент плана
@@ -268,10 +295,10 @@ async def view_plan_item_handler(callback: CallbackQuery, state: FSMContext):
     await state.update_data(context=text)
     # Клавиатура действий
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="✨ Создать текст поста", callback_data=f"cp_item_gen_{item.id_}")],
+        [InlineKeyboardButton(text="✨ Создать текст поста", callback_data=GenerateContentPlanItemCallback(item_id=item.id_).pack())],
         # Кнопка "Назад" должна возвращать в меню самого плана.
         # Нам нужен plan_id, он есть в item.content_plan_id
-        [InlineKeyboardButton(text="⬅️ Назад к плану", callback_data=f"content_plan_manage_{item.content_plan_id}")]
+        [InlineKeyboardButton(text="⬅️ Назад к плану", callback_data=ManageContentPlanCallback(plan_id=item.content_plan_id).pack())]
     ])
 
     await callback.message.edit_text(
@@ -281,22 +308,28 @@ async def view_plan_item_handler(callback: CallbackQuery, state: FSMContext):
     )
 
 
-async def get_text_edit_keyboard(item_id: int) -> InlineKeyboardMarkup:
+@lru_cache(maxsize=128)
+def get_text_edit_keyboard(item_id: int) -> InlineKeyboardMarkup:
+    """Клавиатура редактирования поста; кешируется, так как зависит только от item_id."""
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [InlineKeyboardButton(text="✏️ Отредактировать текст", callback_data="content_plan_edit_text")],
-            [InlineKeyboardButton(text="⬅️ К деталям темы", callback_data=f"cp_item_view_{item_id}")],
+            [InlineKeyboardButton(text="⬅️ К деталям темы", callback_data=ViewContentPlanItemCallback(item_id=item_id).pack())],
         ]
     )
 
 
 # === РЕДАКТИРОВАНИЕ СГЕНЕРИРОВАННОГО ПОСТА ===
-@content_plan_menu_router.callback_query(F.data.startswith("cp_item_gen_"))
-async def generate_post_from_plan_handler(callback: CallbackQuery, state: FSMContext):
+@content_plan_menu_router.callback_query(GenerateContentPlanItemCallback.filter())
+async def generate_post_from_plan_handler(
+        callback: CallbackQuery,
+        callback_data: GenerateContentPlanItemCallback,
+        state: FSMContext,
+):
     """
     Запуск генерации текста поста на основе элемента контент-плана.
     """
-    item_id = int(callback.data.split("_")[-1])
+    item_id = callback_data.item_id
     content_plan_service: ContentPlanService = dispatcher["content_plan_service"]
     text_gen_service: TextGenerationService = dispatcher["text_content_generation_service"]
 
@@ -338,7 +371,7 @@ async def generate_post_from_plan_handler(callback: CallbackQuery, state: FSMCon
         )
         await state.update_data(item_id=item.id_)
 
-        keyboard = await get_text_edit_keyboard(item.id_)
+        keyboard = get_text_edit_keyboard(item.id_)
 
         await callback.message.answer(
             text=generated_text,
@@ -391,7 +424,7 @@ async def text_edit_handler(message: Message, state: FSMContext):
         await state.update_data(generated_text=edited_text)
 
         item_id = await state.get_value("item_id")
-        keyboard = await get_text_edit_keyboard(item_id)
+        keyboard = get_text_edit_keyboard(item_id)
 
         await message.answer(
             "✅ **Текст отредактирован!**\n\n"
@@ -404,7 +437,7 @@ async def text_edit_handler(message: Message, state: FSMContext):
     except Exception as e:
         logger.exception(f"Ошибка редактирования текста: {e}")
         item_id = await state.get_value("item_id")
-        keyboard = await get_text_edit_keyboard(item_id)
+        keyboard = get_text_edit_keyboard(item_id)
         await message.answer(
             "❌ Ошибка редактирования текста. Попробуйте снова.",
             reply_markup=keyboard,
@@ -7,6 +7,7 @@ from aiogram.types.input_file import BufferedInputFile
 from aiogram.enums.parse_mode import ParseMode
 
 from bot import dispatcher, bot
+from bot.inline_keyboards import BACK_TO_START_KEYBOARD, YES_NO_KEYBOARD, BACK_TO_MAIN_MENU_ROW, CREATE_AGAIN_ROW
 from bot.states import ImageGeneration, ContentGeneration
 from services.image_generation import ImageGenerationService
 from services.ngo_service import NGOService
@@ -312,7 +313,7 @@ async def generate_cards_handler(message: Message, state: FSMContext):
 
         await message.answer(
             "✨ Все материалы готовы к публикации! Что хотите сделать дальше?",
-            reply_markup=get_post_generation_keyboard(),
+            reply_markup=POST_GENERATION_KEYBOARD,
         )
         await state.set_state(ContentGeneration.waiting_for_confirmation)
 
@@ -528,7 +529,7 @@ IMAGE_GENERATION_KEYBOARD = InlineKeyboardMarkup(
         [InlineKeyboardButton(text="✍️ Описать изображение", callback_data=DESCRIBE_IMAGE_CALLBACK_DATA)],
         # FIXME: Из созданного контента не работает
         # [InlineKeyboardButton(text="🎭 Из созданного контента", callback_data="image_from_content")],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
+        BACK_TO_MAIN_MENU_ROW
     ]
 )
 
@@ -649,7 +650,6 @@ async def size_handler(message: Message, state: FSMContext):
         f"📐 Размер: {width}x{height}",
         reply_markup=ReplyKeyboardRemove(),
     )
-    from bot.handlers.start import BACK_TO_START_KEYBOARD
 
     try:
         # Получаем сервис генерации изображений
@@ -956,7 +956,6 @@ async def generate_final_image(callback: CallbackQuery, state: FSMContext, width
         )
 
         # Создаем файл для отправки
-        from aiogram.types.input_file import BufferedInputFile
         image_file = BufferedInputFile(image_bytes, "generated_image.png")
 
         await callback.message.answer_photo(
@@ -1024,7 +1023,7 @@ async def card_photo_none_handler(callback: CallbackQuery, state: FSMContext):
 
 POST_GENERATION_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
-        [InlineKeyboardButton(text="🔄 Создать ещё", callback_data="create_again")],
+        CREATE_AGAIN_ROW,
         [InlineKeyboardButton(text="💡 Советы по продвижению", callback_data="get_tips")],
         [InlineKeyboardButton(text="✏️ Переработать текст", callback_data="refactor_content")]
     ]
@@ -1251,17 +1250,10 @@ NGO_DATA_MISSING_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
         [InlineKeyboardButton(text="✅ Да", callback_data="yes_fill_ngo"),
          InlineKeyboardButton(text="❌ Нет", callback_data="no_fill_ngo")],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
+        BACK_TO_MAIN_MENU_ROW
     ]
 )
 
-YES_NO_KEYBOARD = InlineKeyboardMarkup(
-    inline_keyboard=[
-        [InlineKeyboardButton(text="✅ Да", callback_data="yes"),
-         InlineKeyboardButton(text="❌ Нет", callback_data="no")],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
-    ]
-)
 
 
 @image_generation_router.callback_query(F.data == "structured_content")
@@ -10,6 +10,7 @@ from aiogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, C
 from aiogram.filters import Command
 
 from bot import dispatcher
+from bot.inline_keyboards import BACK_TO_START_KEYBOARD, BACK_TO_MAIN_MENU_ROW
 from bot.states import NGOInfo
 from services.ngo_service import NGOService
 
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 
 NGO_DONE_CALLBACK = "ngo_done"
+NGO_DONE_ROW = [InlineKeyboardButton(text="✅ Готово", callback_data=NGO_DONE_CALLBACK)]
 
 UPDATE_NGO_CONTENT_CALLBACK_DATA = "update_ngo"
 VIEW_NGO_INFO_CALLBACK_DATA = "ngo_info"
@@ -31,20 +33,20 @@ NGO_INFO_MENU_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
         [InlineKeyboardButton(text="📋 Посмотреть мою НКО", callback_data="view_ngo")],
         [InlineKeyboardButton(text="🔄 Обновить данные НКО", callback_data=UPDATE_NGO_CONTENT_CALLBACK_DATA)],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)],
+        BACK_TO_MAIN_MENU_ROW,
     ]
 )
 
 NGO_BACK_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)],
+        BACK_TO_MAIN_MENU_ROW,
     ]
 )
 
 NGO_BACK_CONF_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)],
-        [InlineKeyboardButton(text="✅ Готово", callback_data=NGO_DONE_CALLBACK)],
+        BACK_TO_MAIN_MENU_ROW,
+        NGO_DONE_ROW,
     ]
 )
 
@@ -53,7 +55,7 @@ FILL_NGO_INFO_CALLBACK_DATA = "fill_ngo"
 NGO_INFO_MENU_KEYBOARD_NO_NGO = InlineKeyboardMarkup(
     inline_keyboard=[
         [InlineKeyboardButton(text="🏢 Заполнить информацию об НКО", callback_data=FILL_NGO_INFO_CALLBACK_DATA)],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)],
+        BACK_TO_MAIN_MENU_ROW,
     ]
 )
 
@@ -261,19 +263,20 @@ async def view_ngo_handler(callback: CallbackQuery, state: FSMContext):
 
 
 NGO_CANCEL_CALLBACK = "ngo_cancel"
+NGO_CANCEL_ROW = [InlineKeyboardButton(text="❌ Отмена", callback_data=NGO_CANCEL_CALLBACK)]
 NGO_SKIP_CALLBACK = "ngo_skip"
 
 NGO_NAVIGATION_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
-        [InlineKeyboardButton(text="❌ Отмена", callback_data=NGO_CANCEL_CALLBACK)],
+        NGO_CANCEL_ROW,
         [InlineKeyboardButton(text="⏩ Пропустить", callback_data=NGO_SKIP_CALLBACK)],
-        [InlineKeyboardButton(text="✅ Готово", callback_data=NGO_DONE_CALLBACK)]
+        NGO_DONE_ROW
     ]
 )
 
 NGO_CANCEL_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
-        [InlineKeyboardButton(text="❌ Отмена", callback_data=NGO_CANCEL_CALLBACK)],
+        NGO_CANCEL_ROW,
     ]
 )
 
@@ -325,7 +328,6 @@ async def ngo_done_handler(callback: CallbackQuery, state: FSMContext):
 
         # Сохраняем в БД
         ngo_service.create_ngo(ngo)
-        from bot.handlers.start import BACK_TO_START_KEYBOARD
 
         await callback.message.answer(
             f"✅ Информация о НКО \"{ngo.name}\" успешно сохранена в базу данных!\n\n"
@@ -12,6 +12,7 @@ from models import Ngo
 from services.ngo_service import NGOService
 
 from bot import dispatcher
+from bot.inline_keyboards import BACK_TO_START_MENU_CALLBACK_DATA
 
 from bot.handlers.ngo_info import VIEW_NGO_INFO_CALLBACK_DATA
 from bot.handlers.content_plan_menu import CONTENT_PLAN_MENU_CALLBACK_DATA
@@ -25,7 +26,6 @@ logger = logging.getLogger(__name__)
 
 start_router = Router(name="start")
 
-BACK_TO_START_MENU_CALLBACK_DATA = "back_to_start_menu"
 BACK_TO_MAIN_MENU_CALLBACK_DATA = "back_to_main"
 
 
@@ -51,11 +51,6 @@ START_MENU_KEYBOARD = InlineKeyboardMarkup(
 )
 
 
-BACK_TO_START_KEYBOARD = InlineKeyboardMarkup(
-    inline_keyboard=[
-        [InlineKeyboardButton(text="Вернуться в главное меню", callback_data=BACK_TO_START_MENU_CALLBACK_DATA)],
-    ]
-)
 
 # TODO: реализуй обработку возвращения в главное меню
 
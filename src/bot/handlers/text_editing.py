@@ -11,6 +11,7 @@ from services.text_generation import TextGenerationService
 from services.ngo_service import NGOService
 
 from bot import dispatcher
+from bot.inline_keyboards import BACK_TO_START_KEYBOARD
 from bot.states import ContentGeneration, EditText
 
 from dtos import EditPromptContext
@@ -18,11 +19,19 @@ from dtos import EditPromptContext
 from models import Ngo
 
 
-BACK_TO_START_MENU_CALLBACK_DATA = "back_to_start_menu"
+BACK_TO_MAIN_MENU_CALLBACK_DATA = "back_to_main"
 
-BACK_TO_START_KEYBOARD = InlineKeyboardMarkup(
+
+TEXT_EDITING_MENU_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="✅ Начать редактирование", callback_data="start_text_editing")],
+        [InlineKeyboardButton(text="⬅️ Назад в главное меню", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
+    ]
+)
+
+TEXT_EDITING_CANCEL_KEYBOARD = InlineKeyboardMarkup(
     inline_keyboard=[
-        [InlineKeyboardButton(text="Вернуться в главное меню", callback_data=BACK_TO_START_MENU_CALLBACK_DATA)],
+        [InlineKeyboardButton(text="❌ Отмена", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
     ]
 )
 
@@ -34,8 +43,6 @@ EDIT_TEXT_CALLBACK_DATA = "edit_text"
 
 @text_editing_router.message(EditText.waiting_for_text, F.text)
 async def text_handler(message: Message, state: FSMContext):
-    from bot.handlers.start import BACK_TO_START_KEYBOARD
-
     text_to_edit = message.text.strip()
     if not text_to_edit:
         await message.answer(
@@ -149,18 +156,11 @@ async def edit_text_handler(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
     await state.clear()
 
-    from bot.handlers.start import BACK_TO_MAIN_MENU_CALLBACK_DATA
-
     await callback.message.answer(
         "📝 Редактирование текста\n\n"
         "Эта функция поможет исправить грамматику, орфографию, стиль и логику вашего текста.\n\n"
         "**Что сделать?**",
-        reply_markup=InlineKeyboardMarkup(
-            inline_keyboard=[
-                [InlineKeyboardButton(text="✅ Начать редактирование", callback_data="start_text_editing")],
-                [InlineKeyboardButton(text="⬅️ Назад в главное меню", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
-            ]
-        ),
+        reply_markup=TEXT_EDITING_MENU_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -170,8 +170,6 @@ async def start_text_editing_handler(callback: CallbackQuery, state: FSMContext)
     """Обработчик начала редактирования текста."""
     await callback.answer()
 
-    from bot.handlers.start import BACK_TO_MAIN_MENU_CALLBACK_DATA
-
     await state.clear()
     await state.set_state(EditText.waiting_for_text)
 
@@ -179,11 +177,7 @@ async def start_text_editing_handler(callback: CallbackQuery, state: FSMContext)
         "📝 **Редактирование текста**\n\n"
         "Введите полностью текст, который нужно исправить.\n\n"
         "_Вы можете отправить любой текст для исправления грамматики, орфографии, стиля и логики._",
-        reply_markup=InlineKeyboardMarkup(
-            inline_keyboard=[
-                [InlineKeyboardButton(text="❌ Отмена", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
-            ]
-        ),
+        reply_markup=TEXT_EDITING_CANCEL_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -4,14 +4,16 @@ from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import BufferedInputFile, CallbackQuery, Message, ReplyKeyboardRemove, FSInputFile
 from aiogram.enums.parse_mode import ParseMode
+from aiogram.utils.chat_action import ChatActionSender
 from aiogram.types.inline_keyboard_button import InlineKeyboardButton
 from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
 
 
 from models import Ngo
-from dtos import PromptContext, Dimensions
+from dtos import PromptContext, EditPromptContext, Dimensions
 
 from bot import dispatcher,bot
+from bot.inline_keyboards import YES_NO_KEYBOARD, BACK_TO_START_MENU_CALLBACK_DATA, BACK_TO_PREVIOUS_ROW, CREATE_AGAIN_ROW
 from bot.states import ContentWizard, ContentGeneration
 from bot.assets import TEXT_SETUP_PHOTO, CALENDAR_PHOTO, LOCATION_PHOTO, INSPECT_PHOTO, NARRATIVE_STYLE_PHOTO, \
     PLATFORM_PHOTO, TEXT_GENERATION_PHOTO, IMAGE_GENERATION_PHOTO, CARD_GENERATION_PHOTO
@@ -24,18 +26,11 @@ from dtos import RenderParameters, CardTemplate, CardData, EventData
 
 BACK_TO_MAIN_MENU_CALLBACK_DATA = "back_to_main"
 
+# Разметка не содержит состояния, поэтому используем один экземпляр на весь модуль
+REMOVE_KEYBOARD = ReplyKeyboardRemove()
 
-YES_NO_KEYBOARD = InlineKeyboardMarkup(
-    inline_keyboard=[
-        [InlineKeyboardButton(text="✅ Да", callback_data="yes"),
-         InlineKeyboardButton(text="❌ Нет", callback_data="no")],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
-    ]
-)
 
 
-BACK_TO_START_MENU_CALLBACK_DATA = "back_to_start_menu"
-
 logger = logging.getLogger(__name__)
 
 create_content_wizard = Router(name="wizard")
@@ -43,6 +38,67 @@ create_content_wizard = Router(name="wizard")
 
 WIZARD_CREATE_CONTENT = "create_content_wizard"
 
+# Длина фрагмента исходного поста, передаваемого в промпт для текста карточки
+CARD_PROMPT_SOURCE_MAX_LENGTH = 500
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Обрезать текст до limit символов, добавив многоточие."""
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+
+# Максимальная длина заголовка карточки (вместе с многоточием)
+CARD_TITLE_MAX_LENGTH = 50
+
+
+def _truncate_title(title: str, limit: int = CARD_TITLE_MAX_LENGTH) -> str:
+    """Очистить заголовок и уложить его в limit символов вместе с многоточием."""
+    title = title.strip() if title else ""
+    return title if len(title) <= limit else f"{title[:limit - 3]}..."
+
+
+# Данные Wizard, которые остаются в FSM после его завершения: только то, что
+# нужно для перегенерации карточки. Изображения хранятся как file_id Telegram,
+# а не байтами, и при перегенерации скачиваются заново
+WIZARD_REGENERATION_KEYS = (
+    "generated_text",
+    "image_source",
+    "generated_image_file_id",
+    "user_image_file_id",
+    "wizard_mode",
+    "event_type",
+    "event_date",
+    "event_place",
+    "event_audience",
+)
+
+
+async def _load_wizard_image(data: dict) -> bytes | None:
+    """
+    Изображение для карточки Wizard.
+
+    Пока Wizard не завершен, байты изображения лежат в FSM. После завершения
+    там остается только file_id, и изображение скачивается из Telegram.
+    """
+    image_source = data.get("image_source", "")
+    if image_source == "🤖 Сгенерировать ИИ":
+        image, file_id = data.get("generated_image"), data.get("generated_image_file_id")
+    elif image_source == "📎 Загрузить своё":
+        image, file_id = data.get("user_image"), data.get("user_image_file_id")
+    else:
+        return None
+
+    if image is None and file_id:
+        image_file = await bot.download(file_id, destination=None)
+        image = image_file.read()
+
+    return image
+
+
+def _fallback_card_title(data: dict) -> str:
+    """Заголовок карточки на случай, если GPT его не сгенерировал."""
+    event_type = _truncate_title(data.get("event_type", ""), 30)
+    return event_type or "Присоединяйтесь к событию!"
 
 
 # ===== ЭТАП 1: ЗАПУСК WIZARD =====
@@ -85,7 +141,6 @@ async def start_wizard_handler(callback: CallbackQuery, state: FSMContext):
 @create_content_wizard.callback_query(F.data == "create_content_wizard_structured")
 async def wizard_structured_mode_handler(callback: CallbackQuery, state: FSMContext):
     """Обработчик выбора структурированной формы."""
-    from bot.handlers.start import BACK_TO_START_KEYBOARD
     await callback.answer()
     await state.update_data(wizard_mode="structured")
 
@@ -206,7 +261,7 @@ async def wizard_proceed_to_text_setup(callback: CallbackQuery, state: FSMContex
     await callback.message.answer_photo(
         photo=TEXT_SETUP_PHOTO,
         caption=text,
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -229,7 +284,7 @@ async def wizard_text_setup_handler(message: Message, state: FSMContext):
             photo=CALENDAR_PHOTO,
             caption="📅 **Когда состоится событие?**\n"
             "Укажите дату и время проведения.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
             parse_mode=ParseMode.MARKDOWN,
         )
         await state.set_state(ContentWizard.waiting_for_wizard_event_date)
@@ -293,7 +348,7 @@ NARRATIVE_STYLE_KEYBOARD = InlineKeyboardMarkup(
         [InlineKeyboardButton(text="🎨 Художественный стиль", callback_data="narrative_artistic")],
         [InlineKeyboardButton(text="🌟 Позитивный/мотивирующий стиль", callback_data="narrative_motivational")],
         # TODO: Добавь указание своего стиля
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data="back_to_previous")]
+        BACK_TO_PREVIOUS_ROW
     ]
 )
 
@@ -395,7 +450,7 @@ async def wizard_start_text_generation(message_or_callback, state: FSMContext):
     await message_or_callback.answer_photo(
         photo=TEXT_GENERATION_PHOTO,
         caption="🧠 **Генерируем текст поста...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -447,8 +502,8 @@ async def wizard_start_text_generation(message_or_callback, state: FSMContext):
         )
         await state.set_state(ContentWizard.waiting_for_wizard_text_result)
 
-    except Exception as e:
-        logger.exception(f"Ошибка генерации текста: {e}")
+    except Exception:
+        logger.exception("Ошибка генерации текста")
         await message_or_callback.answer(
             "❌ Произошла ошибка при генерации текста. Попробуйте снова.",
             reply_markup=CONTENT_WIZARD_SELECT_MODE_KEYBOARD,
@@ -486,7 +541,7 @@ async def wizard_text_edit_handler(callback: CallbackQuery, state: FSMContext):
         "✏️ **Редактирование текста**\n\n"
         "Опишите, как именно нужно изменить текст:\n\n"
         "_Например: «Сделаи короче», «Измени стиль», «Добавь призыв к действию»_",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_text_edit)
@@ -527,7 +582,7 @@ async def wizard_text_change_fields_handler(callback: CallbackQuery, state: FSMC
             "ℹ️ **Изменение описания**\n\n"
             "В свободной форме вы можете изменить описание поста.\n\n"
             "Новое описание:",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
         await state.set_state(ContentWizard.waiting_for_wizard_text_field_select)
 
@@ -565,7 +620,7 @@ async def wizard_regenerate_random_handler(callback: CallbackQuery, state: FSMCo
 
     await callback.message.answer(
         "🔄 **Перегенерируем текст...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -581,7 +636,7 @@ async def wizard_regenerate_custom_handler(callback: CallbackQuery, state: FSMCo
     await callback.message.answer(
         "🔄 **Перегенерация текста**\n\n"
         "Опишите, что именно нужно изменить в тексте:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_text_regenerate)
 
@@ -594,7 +649,7 @@ async def wizard_text_regenerate_custom_handler(message: Message, state: FSMCont
 
     await message.answer(
         "🔄 **Перегенерируем текст...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -609,24 +664,24 @@ async def wizard_text_regenerate_custom_handler(message: Message, state: FSMCont
 async def wizard_text_edit_handler(message: Message, state: FSMContext):
     """Обработка редактирования текста."""
     edit_instruction = message.text.strip()
-    await state.update_data(edit_instruction=edit_instruction)
+    # update_data возвращает актуальные данные, повторный get_data не нужен
+    data = await state.update_data(edit_instruction=edit_instruction)
 
     await message.answer(
         "✏️ **Редактируем текст...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
 
     try:
         # Получаем текущий сгенерированный текст
-        data = await state.get_data()
-        current_text = data.get["generated_text"]
+        current_text = data["generated_text"]
 
-        # Используем text_editing сервис для редактирования
-
-        text_generation_service: TextGenerationService = TextGenerationService()
+        text_generation_service: TextGenerationService = dispatcher["text_content_generation_service"]
         edited_text = await text_generation_service.edit_text(
-            text=current_text,
-            instructions=edit_instruction
+            EditPromptContext(
+                text_to_edit=current_text,
+                details=edit_instruction,
+            )
         )
 
         await state.update_data(generated_text=edited_text)
@@ -640,8 +695,8 @@ async def wizard_text_edit_handler(message: Message, state: FSMContext):
         )
         await state.set_state(ContentWizard.waiting_for_wizard_text_result)
 
-    except Exception as e:
-        logger.exception(f"Ошибка редактирования текста: {e}")
+    except Exception:
+        logger.exception("Ошибка редактирования текста")
         await message.answer(
             "❌ Ошибка редактирования текста. Попробуйте снова.",
             reply_markup=WIZARD_CONTENT_GENERATION_MANAGEMENT_KEYBOARD,
@@ -656,7 +711,7 @@ async def wizard_edit_event_type_handler(callback: CallbackQuery, state: FSMCont
     await callback.message.answer(
         "📝 **Изменение типа события**\n\n"
         "Текущее значение -  сохранено. Новое значение:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_event_type_edit)
 
@@ -667,7 +722,7 @@ async def wizard_edit_event_date_handler(callback: CallbackQuery, state: FSMCont
     await callback.message.answer(
         "📅 **Изменение даты события**\n\n"
         "Текущее значение - сохранено. Новое значение:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_event_date_edit)
 
@@ -678,7 +733,7 @@ async def wizard_edit_event_place_handler(callback: CallbackQuery, state: FSMCon
     await callback.message.answer(
         "📍 **Изменение места события**\n\n"
         "Текущее значение - сохранено. Новое значение:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_event_place_edit)
 
@@ -689,7 +744,7 @@ async def wizard_edit_event_audience_handler(callback: CallbackQuery, state: FSM
     await callback.message.answer(
         "👥 **Изменение аудитории**\n\n"
         "Текущее значение - сохранено. Новое значение:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_event_audience_edit)
 
@@ -700,7 +755,7 @@ async def wizard_edit_event_details_handler(callback: CallbackQuery, state: FSMC
     await callback.message.answer(
         "📝 **Изменение деталей события**\n\n"
         "Текущее значение - сохранено. Новое значение:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_event_details_edit)
 
@@ -720,7 +775,7 @@ PLATFORM_KEYBOARD = InlineKeyboardMarkup(
         # [InlineKeyboardButton(text="📱 ВКонтакте (для молодежи)", callback_data="platform_vk")],
         [InlineKeyboardButton(text="💬 Telegram (для взрослых/бизнеса)", callback_data="platform_telegram")],
         # [InlineKeyboardButton(text="🌐 Сайт (для информационных материалов)", callback_data="platform_website")],
-        [InlineKeyboardButton(text="⬅️ Назад", callback_data="back_to_previous")]
+        BACK_TO_PREVIOUS_ROW
     ]
 )
 
@@ -804,7 +859,7 @@ async def wizard_regenerate_after_field_change(message, state: FSMContext):
     """Перегенерация текста после изменения поля."""
     await message.answer(
         "🔄 **Перегенерируем текст с новыми параметрами...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     await wizard_start_text_generation(message, state)
@@ -822,7 +877,7 @@ async def wizard_image_ai_handler(callback: CallbackQuery, state: FSMContext):
         "🎨 **Описание изображения**\n\n"
         "Опишите, какое изображение создать для поста:\n\n"
         "_Например: «Команда волонтеров помогает пожилым людям»_",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_image_prompt)
@@ -838,7 +893,7 @@ async def wizard_image_upload_handler(callback: CallbackQuery, state: FSMContext
         "📎 **Загрузите ваше изображение**\n\n"
         "Пришлите фотографию, которую хотите использовать в посте.\n"
         "Поддерживаемые форматы: JPEG, PNG.",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_image_user_upload)
 
@@ -889,7 +944,7 @@ async def wizard_image_prompt_handler(message: Message, state: FSMContext):
     # Используем ИИ для улучшения промпта
     await message.answer(
         "🧠 **Улучшаем промпт с помощью ИИ...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -917,7 +972,7 @@ async def wizard_image_prompt_handler(message: Message, state: FSMContext):
         user_prompt = f"Улучши этот промпт для генерации изображения: {image_prompt}"
 
         # Вызываем GPT для улучшения промпта
-        logger.info(f"Начинаю улучшение промпта: '{image_prompt}'")
+        logger.info("Начинаю улучшение промпта: '%s'", image_prompt)
 
         # FIXME: улучши промпт
         enhanced_prompt = await card_generation_service.enhance_prompt(user_prompt, system_prompt)
@@ -925,7 +980,7 @@ async def wizard_image_prompt_handler(message: Message, state: FSMContext):
         # Сохраняем улучшенный промпт
         await state.update_data(enhanced_image_prompt=enhanced_prompt)
 
-        logger.info(f"Промпт улучшен: '{image_prompt}' -> '{enhanced_prompt}'")
+        logger.info("Промпт улучшен: '%s' -> '%s'", image_prompt, enhanced_prompt)
 
         await message.answer(
             "✅ **Улучшенный промпт готов:**\n\n"
@@ -937,8 +992,8 @@ async def wizard_image_prompt_handler(message: Message, state: FSMContext):
         await state.update_data(enhanced_image_prompt=enhanced_prompt)
         await state.set_state(ContentWizard.waiting_for_wizard_image_prompt_edit)
 
-    except Exception as e:
-        logger.exception(f"Ошибка улучшения промпта: {e}")
+    except Exception:
+        logger.exception("Ошибка улучшения промпта")
         await message.answer(
             "⚠️ Не удалось улучшить промпт. Продолжаем с оригиналом.",
             reply_markup=WIZARD_CONTENT_GENERATION_IMAGE_PROMPT_PREVIEW_KEYBOARD,
@@ -954,7 +1009,7 @@ async def wizard_prompt_regenerate_handler(callback: CallbackQuery, state: FSMCo
     await callback.message.answer(
         "🎨 **Новое описание изображения**\n\n"
         "Опишите изображение заново:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_image_prompt)
 
@@ -967,7 +1022,7 @@ async def wizard_prompt_edit_handler(callback: CallbackQuery, state: FSMContext)
     await callback.message.answer(
         "✏️ **Редактирование промпта**\n\n"
         "Введите новый промпт или укажите, что именно изменить в текущем:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_image_prompt_edit)
@@ -993,7 +1048,7 @@ async def wizard_generate_image_handler(callback: CallbackQuery, state: FSMConte
     await callback.message.answer_photo(
         photo=IMAGE_GENERATION_PHOTO,
         caption="🎨 **Генерируем изображение...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -1013,19 +1068,23 @@ async def wizard_generate_image_handler(callback: CallbackQuery, state: FSMConte
             ),
         )
 
-        await state.update_data(generated_image=generated_image)
-
-        from aiogram.types.input_file import BufferedInputFile
-        await callback.message.answer_photo(
+        sent = await callback.message.answer_photo(
             photo=BufferedInputFile(generated_image, "wizard_generated_image.png"),
             caption="✅ **Изображение готово!**\n\n**Что делать дальше?**",
             reply_markup=WIZARD_IMAGE_MANAGEMENT_KEYBOARD,
             parse_mode=ParseMode.MARKDOWN
         )
+
+        # Запоминаем file_id: по нему изображение отправляется повторно без загрузки
+        # и скачивается для карточки после завершения Wizard
+        await state.update_data(
+            generated_image=generated_image,
+            generated_image_file_id=sent.photo[-1].file_id,
+        )
         await state.set_state(ContentWizard.waiting_for_wizard_image_result)
 
-    except Exception as e:
-        logger.exception(f"Ошибка генерации изображения: {e}")
+    except Exception:
+        logger.exception("Ошибка генерации изображения")
         await callback.message.answer(
             "❌ Ошибка генерации изображения. Попробуйте заново.",
             reply_markup=WIZARD_IMAGE_SOURCE_KEYBOARD,
@@ -1048,8 +1107,8 @@ async def wizard_user_image_handler(message: Message, state: FSMContext):
         image_file = await bot.download(photo.file_id, destination=None)
         image_bytes = image_file.read()
 
-        await state.update_data(user_image=image_bytes)
- 
+        await state.update_data(user_image=image_bytes, user_image_file_id=photo.file_id)
+
         await message.answer(
             "✅ **Изображение загружено!**\n\n"
             "**Готово к финальной генерации контента?**",
@@ -1058,11 +1117,11 @@ async def wizard_user_image_handler(message: Message, state: FSMContext):
         )
         await state.set_state(ContentWizard.waiting_for_wizard_final_confirm)
 
-    except Exception as e:
-        logger.exception(f"Ошибка загрузки изображения: {e}")
+    except Exception:
+        logger.exception("Ошибка загрузки изображения")
         await message.answer(
             "❌ Ошибка загрузки изображения. Попробуйте снова.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
 
 
@@ -1081,7 +1140,7 @@ async def wizard_user_document_handler(message: Message, state: FSMContext):
         document_file = await bot.download(message.document.file_id, destination=None)
         image_bytes = document_file.read()
 
-        await state.update_data(user_image=image_bytes)
+        await state.update_data(user_image=image_bytes, user_image_file_id=message.document.file_id)
 
         await message.answer(
             "✅ **Изображение загружено!**\n\n"
@@ -1091,11 +1150,11 @@ async def wizard_user_document_handler(message: Message, state: FSMContext):
         )
         await state.set_state(ContentWizard.waiting_for_wizard_final_confirm)
 
-    except Exception as e:
-        logger.exception(f"Ошибка загрузки документа: {e}")
+    except Exception:
+        logger.exception("Ошибка загрузки документа")
         await message.answer(
             "❌ Ошибка загрузки изображения. Попробуйте снова.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
 
 
@@ -1115,7 +1174,7 @@ async def wizard_image_edit_prompt_handler(callback: CallbackQuery, state: FSMCo
     await callback.message.answer(
         "✏️ **Изменение промпта**\n\n"
         "Опишите новые параметры для изображения:",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_image_prompt)
 
@@ -1212,8 +1271,8 @@ async def wizard_create_content_handler(callback: CallbackQuery, state: FSMConte
 
     await callback.message.answer_photo(
         photo=CARD_GENERATION_PHOTO,
-        content="🎨 **Создаем информационные карточки...**",
-        reply_markup=ReplyKeyboardRemove(),
+        caption="🎨 **Создаем информационные карточки...**",
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
 
@@ -1240,100 +1299,62 @@ async def wizard_create_content_handler(callback: CallbackQuery, state: FSMConte
         wizard_mode = data["wizard_mode"]
 
 
-        # Создаем краткий контент для карточки
-        await callback.message.answer(
-            "🤖 Создаю краткий контент для карточки...",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        try:
-            # Генерируем сокращенный контент специально для карточки
-            card_text_generation_service: TextGenerationService = dispatcher["text_content_generation_service"]
+        async with ChatActionSender.upload_photo(bot=callback.bot, chat_id=callback.message.chat.id):
             card_generation_service: CardGenerationService = dispatcher["card_generation_service"]
 
-            card_text_generation_context = PromptContext.from_dict(data)
-            card_content = await card_generation_service.generate_card_text(card_text_generation_context, generated_text)
-
-            # Используем сгенерированный сокращенный контент, если он получился подходящим
-            if card_content and len(card_content.strip()) > 10 and len(card_content.strip()) < 300:
-                card_content_for_template = card_content.strip()
-                logger.info(f"Используем сокращенный контент для карточки: {len(card_content)} символов")
-            else:
-                # Fallback - обрезаем текст
-                card_content_for_template = f"{generated_text[:300]}..." if len(generated_text) > 300 else generated_text
-                logger.warning(f"GPT дал неподходящий контент ({len(card_content) if card_content else 0} символов), используем fallback")
-
-            await callback.message.answer(
-                "✅ Краткий контент для карточки готов!",
-                reply_markup=ReplyKeyboardRemove(),
+            # FIXME: Телеграм захардкожен
+            parameters = RenderParameters(
+                template=CardTemplate.TELEGRAM
             )
 
-        except Exception as e:
-            logger.exception("Ошибка генерации сокращенного контента для карточки, используем fallback")
-            # Fallback в случае ошибки
-            card_content_for_template = f"{generated_text[:300]}..." if len(generated_text) > 300 else generated_text
-
-        # Генерируем заголовок для карточки на основе текста
-        await callback.message.answer(
-            "🏷️ Создаю заголовок для карточки...",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-
-        card_generation_service: CardGenerationService = dispatcher["card_generation_service"]
-
-        # FIXME: Телеграм захардкожен
-        parameters = RenderParameters(
-            template=CardTemplate.TELEGRAM
-        )
-
-        title = await card_generation_service.generate_card_title(generated_text)
-
-        # Устанавливаем значения по умолчанию
-        ngo_name = ngo_data.name
-        ngo_contact = ngo_data.contacts
-        # platform = data["platform"]
-        event_data = None
-        if wizard_mode == "structured":
-            event_data = EventData(
-                timestamp=data['event_date'],
-                location=data["event_place"],
-                audience=data["event_audience"],
+            title = await card_generation_service.generate_card_title(generated_text)
+            title = _truncate_title(title) or _fallback_card_title(data)
+
+            # Устанавливаем значения по умолчанию
+            ngo_name = ngo_data.name
+            ngo_contact = ngo_data.contacts
+            # platform = data["platform"]
+            event_data = None
+            if wizard_mode == "structured":
+                event_data = EventData(
+                    timestamp=data['event_date'],
+                    location=data["event_place"],
+                    audience=data["event_audience"],
+                )
+
+            card_data = CardData(
+                image=generated_image,
+                title=title,
+                ngo_data=ngo_data,
+                event_data=event_data,
             )
 
-        card_data = CardData(
-            image=generated_image,
-            title=title,
-            ngo_data=ngo_data,
-            event_data=event_data,
-        )
-
-        card = await card_generation_service.generate_card(
-            parameters,
-            card_data
-        )
+            card = await card_generation_service.generate_card(
+                parameters,
+                card_data
+            )
 
         await callback.message.answer(
             "🎨 Вот ваша карточка для соцсетей:",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
 
         await callback.message.answer_photo(
             photo=BufferedInputFile(card, f"wizard_card.png"),
             # caption=caption,
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
 
         # Показываем сгенерированный текст и завершаем Wizard
         await callback.message.answer(
             "📝 **Ваш сгенерированный текст:**",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
             parse_mode=ParseMode.MARKDOWN,
         )
         await callback.message.answer(
             generated_text,
             parse_mode=ParseMode.MARKDOWN,
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
 
         await callback.message.answer(
@@ -1341,10 +1362,13 @@ async def wizard_create_content_handler(callback: CallbackQuery, state: FSMConte
             reply_markup=WIZARD_CARD_READY_KEYBOARD,
         )
 
-        await state.clear()  # Очищаем состояние после успешного завершения
+        # Выходим из сценария и оставляем только данные для перегенерации
+        # карточки, без байтов изображений
+        await state.set_state(None)
+        await state.set_data({key: data[key] for key in WIZARD_REGENERATION_KEYS if key in data})
 
-    except Exception as e:
-        logger.exception(f"Ошибка генерации карточек в Wizard: {e}")
+    except Exception:
+        logger.exception("Ошибка генерации карточек в Wizard")
         await callback.message.answer(
             "❌ Ошибка создания карточек. Попробуйте снова.",
             reply_markup=WIZARD_FINAL_CONFIRM_KEYBOARD,
@@ -1356,7 +1380,7 @@ async def wizard_create_content_handler(callback: CallbackQuery, state: FSMConte
 @create_content_wizard.message(ContentWizard.waiting_for_wizard_image_prompt_edit, F.text)
 async def wizard_image_prompt_edit_handler(message: Message, state: FSMContext):
     """Обработка редактирования промпта."""
-    old_prompt = await state.get_value("enhanced_prompt")
+    old_prompt = await state.get_value("enhanced_image_prompt")
     new_prompt = message.text.strip()
 
     # Получаем сервис генерации текста для улучшения промпта
@@ -1382,7 +1406,7 @@ async def wizard_image_prompt_edit_handler(message: Message, state: FSMContext):
                    f"улучши данный промпт для генерации изображения: {old_prompt}")
 
     # Вызываем GPT для улучшения промпта
-    logger.info(f"Начинаю улучшение промпта: '{old_prompt}'")
+    logger.info("Начинаю улучшение промпта: '%s'", old_prompt)
     raw_response = await text_generation_service.gpt_client.generate(user_prompt, system_prompt)
     enhanced_prompt = text_generation_service.response_processor.process_response(raw_response)
 
@@ -1421,7 +1445,7 @@ async def wizard_regenerate_card_handler(callback: CallbackQuery, state: FSMCont
     await callback.message.answer(
         "🔄 **Перегенерируем карточки...**",
         parse_mode=ParseMode.MARKDOWN,
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
 
     # Получаем сохраненные данные и перезапускаем генерацию карточек
@@ -1432,8 +1456,8 @@ async def wizard_regenerate_card_handler(callback: CallbackQuery, state: FSMCont
         )
         return
 
-    # Перезапускаем финальную генерацию
-    await wizard_create_content_handler(callback, state)
+    # Текст поста уже готов, поэтому перегенерируем только карточку
+    await _build_card_and_send(callback.message, data, None)
 
 
 @create_content_wizard.callback_query(F.data == "wizard_edit_card_text")
@@ -1445,7 +1469,7 @@ async def wizard_edit_card_text_handler(callback: CallbackQuery, state: FSMConte
         "📝 **Редактирование текста карточки**\n\n"
         "Опишите, как нужно изменить текст на карточке:\n\n"
         "_Например: «Сократи текст», «Измени стиль», «Добавь больше призывов к действию»_",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_card_text_edit)
@@ -1460,7 +1484,7 @@ async def wizard_write_card_prompt_handler(callback: CallbackQuery, state: FSMCo
         "📝 **Создание промпта для текста карточки**\n\n"
         "Опишите, какой текст должен быть на карточке:\n\n"
         "_Например: «Сделай текст очень коротким, только суть события и контакты»_",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
     await state.set_state(ContentWizard.waiting_for_wizard_card_prompt)
@@ -1472,43 +1496,44 @@ async def wizard_write_card_prompt_handler(callback: CallbackQuery, state: FSMCo
 async def wizard_update_card_text_handler(message: Message, state: FSMContext):
     """Обработка редактирования текста карточки."""
     edit_instruction = message.text.strip()
-    await state.update_data(card_text_edit_instruction=edit_instruction)
+    data = await state.update_data(card_text_edit_instruction=edit_instruction)
 
     await message.answer(
         "✏️ **Обновляем текст карточки...**",
         parse_mode=ParseMode.MARKDOWN,
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
 
     try:
         # Получаем текущий сгенерированный текст
-        data = await state.get_data()
         current_text = data.get("generated_text", "")
 
-        # Используем text_editing сервис для редактирования
-        from services.text_editing import TextEditingService
-        editing_service = TextEditingService()
+        text_generation_service: TextGenerationService = dispatcher["text_content_generation_service"]
 
-        # Генерируем краткий текст специально для карточки с учетом инструкции
-        edited_card_text = await editing_service.edit_text(
-            text=current_text,
-            instructions=f"Создай краткий текст (до 300 символов) для карточки НКО: {edit_instruction}"
+        # Текст на карточке - это ее заголовок, поэтому генерируем
+        # короткий заголовок с учетом инструкции
+        edited_card_title = await text_generation_service.edit_text(
+            EditPromptContext(
+                text_to_edit=current_text,
+                details=f"Создай краткий заголовок (до {CARD_TITLE_MAX_LENGTH} символов) для карточки НКО: {edit_instruction}",
+            )
         )
+        edited_card_title = _truncate_title(edited_card_title) or _fallback_card_title(data)
 
-        await state.update_data(card_custom_text=edited_card_text)
+        await state.update_data(card_custom_text=edited_card_title)
 
         await message.answer(
-            "✅ **Текст карточки обновлен:*\n\n"
-            f"{edited_card_text}\n\n"
-            "🔄 **Перегенерируем карточки с новым текстом...**",
+            "✅ **Заголовок карточки обновлен:**\n\n"
+            f"{edited_card_title}\n\n"
+            "🔄 **Перегенерируем карточку с новым заголовком...**",
             parse_mode=ParseMode.MARKDOWN,
         )
 
-        # Перезапускаем генерацию карточек с новым текстом
-        await wizard_regenerate_card_from_text(message, state, edited_card_text)
+        # Перезапускаем генерацию карточки с новым заголовком
+        await wizard_regenerate_card_from_text(message, data, edited_card_title)
 
-    except Exception as e:
-        logger.exception(f"Ошибка редактирования текста карточки: {e}")
+    except Exception:
+        logger.exception("Ошибка редактирования текста карточки")
         await message.answer(
             "❌ Ошибка редактирования текста карточки. Попробуем перегенерировать.",
         )
@@ -1521,197 +1546,61 @@ async def wizard_update_card_text_handler(message: Message, state: FSMContext):
 async def wizard_generate_card_from_prompt_handler(message: Message, state: FSMContext):
     """Обработка промпта для создания текста карточки."""
     card_prompt = message.text.strip()
-    await state.update_data(card_text_prompt=card_prompt)
+    data = await state.update_data(card_text_prompt=card_prompt)
 
     await message.answer(
         "🤖 **Создаю текст для карточки по вашему промпту...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
     )
 
     try:
         # Генерируем новый текст для карточки на основе промпта
         text_generation_service: TextGenerationService = dispatcher["text_content_generation_service"]
 
-        # Получаем данные из state
-        data = await state.get_data()
         original_text = data.get("generated_text", "")
 
-        # Создаем промпт для генерации текста карточки
-        card_generation_prompt = (
-            f"Исходный текст: {original_text[:500]}...\n\n"
-            f"Задача: {card_prompt}\n\n"
-            "Создай краткий текст (до 300 символов) для информационной карточки НКО."
+        # generate_text ожидает PromptContext поста, поэтому заголовок карточки
+        # получаем через edit_text, как и при редактировании текста карточки
+        card_title = await text_generation_service.edit_text(
+            EditPromptContext(
+                text_to_edit=_truncate(original_text, CARD_PROMPT_SOURCE_MAX_LENGTH),
+                details=(
+                    f"Задача: {card_prompt}\n\n"
+                    f"Создай краткий заголовок (до {CARD_TITLE_MAX_LENGTH} символов) для информационной карточки НКО."
+                ),
+            )
         )
 
-        card_text = await text_generation_service.generate_text(card_generation_prompt, card_generation_prompt)
-
-        if card_text and len(card_text.strip()) > 10 and len(card_text.strip()) < 300:
-            await state.update_data(card_custom_text=card_text.strip())
+        card_title = _truncate_title(card_title)
+        if card_title:
+            await state.update_data(card_custom_text=card_title)
 
             await message.answer(
-                "✅ **Текст для карточки создан:*\n\n"
-                f"{card_text}\n\n"
-                "🔄 **Перегенерируем карточки с новым текстом...**",
+                "✅ **Заголовок для карточки создан:**\n\n"
+                f"{card_title}\n\n"
+                "🔄 **Перегенерируем карточку с новым заголовком...**",
                 parse_mode=ParseMode.MARKDOWN,
             )
 
-            # Перезапускаем генерацию карточек с новым текстом
-            await wizard_regenerate_card_from_text(message, state, card_text.strip())
+            # Перезапускаем генерацию карточки с новым заголовком
+            await wizard_regenerate_card_from_text(message, data, card_title)
         else:
             await message.answer(
-                "⚠️ **Созданный текст не подходит для карточки. Попробуйте другой промпт.**",
+                "⚠️ **Не удалось создать заголовок для карточки. Попробуйте другой промпт.**",
                 reply_markup=WIZARD_CARD_READY_KEYBOARD,
             )
 
-    except Exception as e:
-        logger.exception(f"Ошибка генерации текста карточки по промпту: {e}")
+    except Exception:
+        logger.exception("Ошибка генерации текста карточки по промпту")
         await message.answer(
             "❌ Ошибка создания текста карточки. Попробуйте перегенерацию.",
         )
         await wizard_regenerate_card_handler_from_message(message, state)
 
 
-async def wizard_regenerate_card_from_text(message: Message, state: FSMContext, card_text: str):
-    """Перегенерация карточек с указанным текстом."""
-
-    card_generation_service: CardGenerationService = dispatcher["card_generation_service"]
-
-    try:
-        # Получаем сохраненные данные из Wizard
-        data = await state.get_data()
-        platform = data["platform"]
-
-        # Получаем информацию об НКО из базы данных
-        ngo_service: TextGenerationService = dispatcher["ngo_service"]
-        user_id = message.from_user.id
-        ngo_data = ngo_service.get_ngo_data_by_user_id(user_id)
-
-        # Устанавливаем значения по умолчанию
-        ngo_name = ngo_data.name
-        ngo_contact = ngo_data.contacts
-
-        # Получаем изображение
-        generated_image = None
-        image_source = data["image_source"]
-        if image_source == "🤖 Сгенерировать ИИ":
-            generated_image = data["generated_image"]
-        elif image_source == "📎 Загрузить своё":
-            generated_image = data["user_image"]
-
-        # Определяем подзаголовок в зависимости от режима
-        wizard_mode = data["wizard_mode"]
-        if wizard_mode == "structured":
-            subtitle = f"Событие: {data['event_type']}"
-        else:
-            subtitle = f"Для {data['event_audience']}"
-
-        # Генерируем заголовок для карточки на основе текста
-        await message.answer(
-            "🏷️ Создаю заголовок для карточки...",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        try:
-            # Используем GPT для генерации привлекательного заголовка
-            title_generation_prompt = (
-                f"Исходный текст поста: {card_text}\n\n"
-                "Создай короткий, привлекательный заголовок (5-7 слов) для информационной карточки НКО. "
-                "Заголовок должен быть ярким, мотивирующим и побуждать к участию. "
-                "Не добавляй кавычки в ответе."
-            )
-
-            title = await card_generation_service.generate_text(title_generation_prompt, title_generation_prompt)
-
-            # Очищаем и ограничиваем длину заголовка
-            if title:
-                title = title.strip()
-                if len(title) > 50:  # Ограничиваем длину
-                    title = title[:47] + "..."
-            else:
-                # Fallback если GPT не сгенерировал заголовок
-                title = data.get('event_type', 'Событие НКО')[:30] + "..."
-
-            await message.answer(
-                f"✅ Заголовок готов: **{title}**",
-                reply_markup=ReplyKeyboardRemove(),
-                parse_mode=ParseMode.MARKDOWN,
-            )
-
-        except Exception as e:
-            logger.exception("Ошибка генерации заголовка для карточки, используем fallback")
-            # Fallback заголовок
-            title = data.get('event_type', 'Событие НКО')[:30] + "..."
-            if len(title) <= 3 or title == "...":  # Если получился слишком короткий
-                title = "Присоединяйтесь к событию!"
-
-        # Подготавливаем данные для генерации карточек
-
-
-        goal = "🎯 Рассказать о мероприятии"
-        template_data = {
-            "title": title,
-            "subtitle": subtitle or "",
-            "content": card_text,  # Используем переданный кастомный текст
-            "org_name": ngo_name or "Ваша НКО",
-            "contact_info": ngo_contact or "",
-            "secondary_color": get_secondary_color_by_goal(goal) or "#764ba2",
-            "text_color": "#333333",
-            "background_color": "#f5f7fa",
-        }
-
-        # Добавляем специфические данные для структурированной формы
-        if wizard_mode == "structured":
-            template_data.update({
-                "event_type": data.get('event_type', ''),
-                "event_date": data.get('event_date', ''),
-                "event_place": data.get('event_place', ''),
-                "event_audience": data.get('event_audience', ''),
-                "event_details": data.get('event_details', ''),
-                "narrative_style": data.get('narrative_style', ''),
-            })
-
-        # Добавляем данные для свободной формы
-        if wizard_mode == "free_form":
-            template_data.update({
-                "user_description": data.get('user_description', ''),
-                "narrative_style": data.get('narrative_style', ''),
-            })
-
-        # Добавляем изображение для фона карточки
-        if generated_image:
-            template_data["background_image_bytes"] = generated_image
-
-        from services.card_generation import CardGenerationService
-        card_generation_service: CardGenerationService = Dispatcher["card_generation_service"]
-
-        card = await card_generation_service.generate_card(
-            parameters,
-            data,
-        )
-
-        await message.answer(
-            "🎨 **Обновленные карточки для соцсетей:**",
-            reply_markup=ReplyKeyboardRemove(),
-            parse_mode=ParseMode.MARKDOWN,
-        )
-
-        await message.answer_photo(
-            photo=BufferedInputFile(card, f"updated_wizard_card.png"),
-            # caption=caption,
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        await message.answer(
-            "✨ **Обновленные материалы готовы к публикации!**",
-            reply_markup=WIZARD_CARD_READY_KEYBOARD,
-        )
-
-    except Exception as e:
-        logger.exception(f"Ошибка перегенерации карточек: {e}")
-        await message.answer(
-            "❌ Ошибка создания обновленных карточек. Попробуйте снова.",
-            reply_markup=WIZARD_CARD_READY_KEYBOARD,
-        )
+async def wizard_regenerate_card_from_text(message: Message, data: dict, card_title: str):
+    """Перегенерация карточки с указанным заголовком."""
+    await _build_card_and_send(message, data, card_title)
 
 
 # FIXME: используетсся?
@@ -1719,210 +1608,127 @@ async def wizard_regenerate_card_handler_from_message(message: Message, state: F
     """Перегенерация карточек из message handler'а."""
     await message.answer(
         "🔄 **Перегенерируем карточки...**",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=REMOVE_KEYBOARD,
         parse_mode=ParseMode.MARKDOWN,
     )
+    data = await state.get_data()
+    await _build_card_and_send(message, data, None)
+
+
+async def _build_card_and_send(message: Message, data: dict, card_title_override: str | None):
+    """
+    Общая логика перегенерации карточки.
+
+    Данные Wizard передаются уже полученными из FSM, чтобы не читать
+    хранилище повторно. Единственный текст на карточке - заголовок: если
+    card_title_override не передан, он генерируется заново по тексту поста.
+    """
+    card_generation_service: CardGenerationService = dispatcher["card_generation_service"]
 
     try:
-        # Получаем сохраненные данные из Wizard
-        data = await state.get_data()
         generated_text = data.get("generated_text", "")
-        platform = data.get("platform", "📱 ВКонтакте (для молодежи)")
 
         # Получаем информацию об НКО из базы данных
-        ngo_service = dispatcher["ngo_service"]
-        user_id = message.from_user.id
-        ngo_data = ngo_service.get_ngo_data_by_user_id(user_id)
-
-        # Устанавливаем значения по умолчанию
-        ngo_name = ngo_data.get("ngo_name", "Ваша НКО") if ngo_data else "Ваша НКО"
-        ngo_contact = ngo_data.get("ngo_contact", "тел: +7 (XXX) XXX-XX-XX") if ngo_data else "тел: +7 (XXX) XXX-XX-XX"
+        ngo_service: NGOService = dispatcher["ngo_service"]
+        user_id = message.chat.id
+        ngo_data: Ngo = ngo_service.get_ngo_data_by_user_id(user_id)
 
         # Получаем изображение (уже должно быть сгенерировано на предыдущих этапах)
-        generated_image = None
         image_source = data.get("image_source", "")
-        if image_source == "🤖 Сгенерировать ИИ":
-            generated_image = data.get("generated_image")
-        elif image_source == "📎 Загрузить своё":
-            generated_image = data.get("user_image")
-
-        # Определяем подзаголовок в зависимости от режима
-        wizard_mode = data.get("wizard_mode", "structured")
-        if wizard_mode == "structured":
-            subtitle = f"Событие: {data.get('event_type', 'мероприятие')}"
-        else:
-            subtitle = f"Для {data.get('event_audience', 'наших подопечных')}"
-
-        # Создаем краткий контент для карточки
-        await message.answer(
-            "🤖 Создаю краткий контент для карточки...",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        try:
-            # Генерируем сокращенный контент специально для карточки
-            card_text_generation_service: TextGenerationService = dispatcher["text_content_generation_service"]
-            card_content = await card_text_generation_service.generate_card_text(data, generated_text)
-
-            # Используем сгенерированный сокращенный контент, если он получился подходящим
-            if card_content and len(card_content.strip()) > 10 and len(card_content.strip()) < 300:
-                card_content_for_template = card_content.strip()
-                logger.info(f"Используем сокращенный контент для карточки: {len(card_content)} символов")
+        generated_image = await _load_wizard_image(data)
+
+        async with ChatActionSender.upload_photo(bot=message.bot, chat_id=message.chat.id):
+            if card_title_override is None:
+                # Генерируем заголовок для карточки на основе текста поста
+                try:
+                    title = await card_generation_service.generate_card_title(generated_text)
+                    title = _truncate_title(title) or _fallback_card_title(data)
+
+                except Exception:
+                    logger.exception("Ошибка генерации заголовка для карточки, используем fallback")
+                    title = _fallback_card_title(data)
             else:
-                # Fallback - обрезаем текст
-                card_content_for_template = f"{generated_text[:300]}..." if len(generated_text) > 300 else generated_text
-                logger.warning(f"GPT дал неподходящий контент ({len(card_content) if card_content else 0} символов), используем fallback")
-
-            await message.answer(
-                "✅ Краткий контент для карточки готов!",
-                reply_markup=ReplyKeyboardRemove(),
+                # Заголовок уже задан пользователем, повторно через GPT его не пропускаем
+                title = card_title_override
+
+            event_data = None
+            if data.get("wizard_mode") == "structured":
+                event_data = EventData(
+                    timestamp=data.get("event_date", ""),
+                    location=data.get("event_place", ""),
+                    audience=data.get("event_audience", ""),
+                )
+
+            card_data = CardData(
+                image=generated_image,
+                title=title,
+                ngo_data=ngo_data,
+                event_data=event_data,
             )
 
-        except Exception as e:
-            logger.exception("Ошибка генерации сокращенного контента для карточки, используем fallback")
-            # Fallback в случае ошибки
-            card_content_for_template = f"{generated_text[:300]}..." if len(generated_text) > 300 else generated_text
-
-        # Генерируем заголовок для карточки на основе текста
-        await message.answer(
-            "🏷️ Создаю заголовок для карточки...",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        try:
-            # Используем GPT для генерации привлекательного заголовка
-            title_generation_prompt = (
-                f"Исходный текст поста: {card_content_for_template}\n\n"
-                "Создай короткий, привлекательный заголовок (5-7 слов) для информационной карточки НКО. "
-                "Заголовок должен быть ярким, мотивирующим и побуждать к участию. "
-                "Не добавляй кавычки в ответе."
+            # FIXME: Телеграм захардкожен
+            parameters = RenderParameters(
+                template=CardTemplate.TELEGRAM
             )
 
-            title = await card_text_generation_service.generate_text(title_generation_prompt, title_generation_prompt)
+            card = await card_generation_service.generate_card(
+                parameters,
+                card_data,
+            )
 
-            # Очищаем и ограничиваем длину заголовка
-            if title:
-                title = title.strip()
-                if len(title) > 50:  # Ограничиваем длину
-                    title = title[:47] + "..."
-            else:
-                # Fallback если GPT не сгенерировал заголовок
-                title = data.get('event_type', 'Событие НКО')[:30] + "..."
+        if card_title_override is None:
+            # Отправляем сгенерированное изображение сначала отдельно (если есть)
+            if generated_image and image_source == "🤖 Сгенерировать ИИ":
+                await message.answer(
+                    "🖼️ **Ваше сгенерированное изображение:**",
+                    reply_markup=REMOVE_KEYBOARD,
+                    parse_mode=ParseMode.MARKDOWN,
+                )
+                await message.answer_photo(
+                    photo=(
+                        data.get("generated_image_file_id")
+                        or BufferedInputFile(generated_image, "wizard_generated_image.png")
+                    ),
+                    caption="🎨 Сгенерированное ИИ изображение",
+                    reply_markup=REMOVE_KEYBOARD,
+                )
 
             await message.answer(
-                f"✅ Заголовок готов: **{title}**",
-                reply_markup=ReplyKeyboardRemove(),
+                "🎨 Вот ваши карточки для соцсетей:",
+                reply_markup=REMOVE_KEYBOARD,
+            )
+        else:
+            await message.answer(
+                "🎨 **Карточка с новым заголовком:**",
+                reply_markup=REMOVE_KEYBOARD,
                 parse_mode=ParseMode.MARKDOWN,
             )
 
-        except Exception as e:
-            logger.exception("Ошибка генерации заголовка для карточки, используем fallback")
-            # Fallback заголовок
-            title = data.get('event_type', 'Событие НКО')[:30] + "..."
-            if len(title) <= 3 or title == "...":  # Если получился слишком короткий
-                title = "Присоединяйтесь к событию!"
-
-        # Подготавливаем данные для генерации карточек
-        from bot.utils import (
-            get_title_by_goal,
-            get_color_by_goal,
-            get_secondary_color_by_goal,
-            get_template_by_platform,
-        )
-
-        goal = "🎯 Рассказать о мероприятии"  # Можем получить из данных Wizard
-
-        template_data = {
-            "title": title,
-            "subtitle": subtitle or "",
-            "content": card_content_for_template,
-            "org_name": ngo_name or "Ваша НКО",
-            "contact_info": ngo_contact or "",
-            "primary_color": get_color_by_goal(goal) or "#667eea",
-            "secondary_color": get_secondary_color_by_goal(goal) or "#764ba2",
-            "text_color": "#333333",
-            "background_color": "#f5f7fa",
-        }
-
-        # Добавляем специфические данные для структурированной формы
-        if wizard_mode == "structured":
-            template_data.update({
-                "event_type": data.get('event_type', ''),
-                "event_date": data.get('event_date', ''),
-                "event_place": data.get('event_place', ''),
-                "event_audience": data.get('event_audience', ''),
-                "event_details": data.get('event_details', ''),
-                "narrative_style": data.get('narrative_style', ''),
-            })
-
-        # Добавляем данные для свободной формы
-        if wizard_mode == "free_form":
-            template_data.update({
-                "user_description": data.get('user_description', ''),
-                "narrative_style": data.get('narrative_style', ''),
-            })
-
-        # Добавляем изображение для фона карточки
-        if generated_image:
-            template_data["background_image_bytes"] = generated_image
-            logger.info(f"Фоновое изображение добавлено: {len(generated_image)} байт")
-
-        template_name = get_template_by_platform(platform)
-        logger.info(f"Using template: {template_name} for platform: {platform}")
-
-        card_generation_service: CardGenerationService = dispatcher["card_generation_service"]
-
-        card = await card_generation_service.generate_card(
-            parameters,
-            data
+        await message.answer_photo(
+            photo=BufferedInputFile(card, "wizard_card.png"),
+            reply_markup=REMOVE_KEYBOARD,
         )
 
-
-        # Отправляем сгенерированное изображение сначала отдельно (если есть)
-        if generated_image and image_source == "🤖 Сгенерировать ИИ":
+        if card_title_override is None:
+            # Показываем сгенерированный текст
             await message.answer(
-                "🖼️ **Ваше сгенерированное изображение:**",
-                reply_markup=ReplyKeyboardRemove(),
+                "📝 **Ваш сгенерированный текст:**",
+                reply_markup=REMOVE_KEYBOARD,
                 parse_mode=ParseMode.MARKDOWN,
             )
-            from aiogram.types.input_file import BufferedInputFile
-            await message.answer_photo(
-                photo=BufferedInputFile(generated_image, "wizard_generated_image.png"),
-                caption="🎨 Сгенерированное ИИ изображение",
-                reply_markup=ReplyKeyboardRemove(),
+            await message.answer(
+                generated_text,
+                parse_mode=ParseMode.MARKDOWN,
+                reply_markup=REMOVE_KEYBOARD,
             )
 
-
-        await message.answer(
-            "🎨 Вот ваши карточки для соцсетей:",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        await message.answer_photo(
-            photo=BufferedInputFile(card, f"wizard_card.png"),
-            # caption=caption,
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
-        # Показываем сгенерированный текст
-        await message.answer(
-            "📝 **Ваш сгенерированный текст:**",
-            reply_markup=ReplyKeyboardRemove(),
-            parse_mode=ParseMode.MARKDOWN,
-        )
-        await message.answer(
-            generated_text,
-            parse_mode=ParseMode.MARKDOWN,
-            reply_markup=ReplyKeyboardRemove(),
-        )
-
         await message.answer(
             "✨ Все материалы готовы к публикации!",
             reply_markup=WIZARD_CARD_READY_KEYBOARD,
         )
 
-    except Exception as e:
-        logger.exception(f"Ошибка перегенерации карточек: {e}")
+    except Exception:
+        logger.exception("Ошибка перегенерации карточек")
         await message.answer(
             "❌ Ошибка перегенерации карточек. Попробуйте снова.",
             reply_markup=WIZARD_CARD_READY_KEYBOARD,
@@ -1938,6 +1744,13 @@ async def create_again_handler(callback: CallbackQuery, state: FSMContext):
     await start_handler(callback.message, state)
 
 
+CREATE_AGAIN_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        CREATE_AGAIN_ROW,
+    ]
+)
+
+
 @create_content_wizard.callback_query(F.data == "get_tips")
 async def get_tips_handler(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
@@ -1958,11 +1771,7 @@ async def get_tips_handler(callback: CallbackQuery, state: FSMContext):
 
     await callback.message.answer(
         f"Цель: {goal}\nАудитория: {audience}\nПлатформа: {platform or '—'}\n\n{tips_text}",
-        reply_markup=InlineKeyboardMarkup(
-            inline_keyboard=[
-                [InlineKeyboardButton(text="🔄 Создать ещё", callback_data="create_again")],
-            ]
-        ),
+        reply_markup=CREATE_AGAIN_KEYBOARD,
     )
 
 
@@ -1,18 +1,49 @@
+"""
+Общие клавиатуры, используемые несколькими роутерами.
+
+Модуль не зависит от обработчиков, поэтому его можно импортировать
+на уровне модуля без риска циклических импортов.
+"""
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
+BACK_TO_START_MENU_CALLBACK_DATA = "back_to_start_menu"
+BACK_TO_MAIN_MENU_CALLBACK_DATA = "back_to_main"
+BACK_TO_PREVIOUS_CALLBACK_DATA = "back_to_previous"
+
+
+# Общие строки кнопок «Назад». Разметка только читается при отправке,
+# поэтому одну и ту же строку можно использовать в нескольких клавиатурах
+BACK_TO_MAIN_MENU_ROW = [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_MAIN_MENU_CALLBACK_DATA)]
+BACK_TO_PREVIOUS_ROW = [InlineKeyboardButton(text="⬅️ Назад", callback_data=BACK_TO_PREVIOUS_CALLBACK_DATA)]
+CREATE_AGAIN_ROW = [InlineKeyboardButton(text="🔄 Создать ещё", callback_data="create_again")]
+
 
+BACK_TO_START_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="Вернуться в главное меню", callback_data=BACK_TO_START_MENU_CALLBACK_DATA)],
+    ]
+)
 
+YES_NO_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="✅ Да", callback_data="yes"),
+         InlineKeyboardButton(text="❌ Нет", callback_data="no")],
+        BACK_TO_MAIN_MENU_ROW,
+    ]
+)
 
+WIZARD_BACK_NAVIGATION_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="⬅️ Назад", callback_data="wizard_back")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="wizard_main_menu")]
+    ]
+)
 
 
 def get_wizard_back_navigation_keyboard() -> InlineKeyboardMarkup:
     """Универсальная клавиатура для навигации назад."""
-    return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="⬅️ Назад", callback_data="wizard_back")],
-            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="wizard_main_menu")]
-        ]
-    )
+    return WIZARD_BACK_NAVIGATION_KEYBOARD
 
 
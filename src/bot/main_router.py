@@ -1,24 +1,33 @@
 # Создаем основной роутер и включаем в него все остальные роутеры
+from importlib import import_module
+
 from aiogram import Router
 
-from bot.handlers.content_plan_generation import content_plan_router
-from bot.handlers.content_plan_menu import content_plan_menu_router
-from bot.handlers.fallback import fallback_router
-from bot.handlers.image_generation import image_generation_router
-from bot.handlers.new_generation import new_generation_router
-from bot.handlers.ngo_info import ngo_info_router
-from bot.handlers.wizard_handler import create_content_wizard
-from bot.handlers.start import start_router
-from bot.handlers.text_editing import text_editing_router
+# Роутеры обработчиков в порядке регистрации в формате "модуль:атрибут".
+# Модули импортируются только при сборке основного роутера, а не при импорте
+# этого модуля, поэтому тяжелые зависимости обработчиков не грузятся заранее.
+_ROUTERS = (
+    "bot.handlers.start:start_router",
+    "bot.handlers.ngo_info:ngo_info_router",
+    "bot.handlers.new_generation:new_generation_router",
+    "bot.handlers.image_generation:image_generation_router",
+    "bot.handlers.wizard_handler:create_content_wizard",
+    "bot.handlers.content_plan_generation:content_plan_router",
+    "bot.handlers.content_plan_menu:content_plan_menu_router",
+    "bot.handlers.text_editing:text_editing_router",
+    "bot.handlers.fallback:fallback_router",
+)
+
 
-router = Router()
-router.include_router(start_router)
-router.include_router(ngo_info_router)
-router.include_router(new_generation_router)
-router.include_router(image_generation_router)
-router.include_router(create_content_wizard)
-router.include_router(content_plan_router)
-router.include_router(content_plan_menu_router)
-router.include_router(text_editing_router)
-router.include_router(fallback_router)
+def build_router() -> Router:
+    """
+    Собирает основной роутер из роутеров обработчиков.
 
+    Returns:
+        Router: Основной роутер со всеми подключенными роутерами
+    """
+    router = Router()
+    for path in _ROUTERS:
+        module_name, attribute = path.split(":")
+        router.include_router(getattr(import_module(module_name), attribute))
+    return router
@@ -1,30 +1,29 @@
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from pathlib import Path
-from typing import Optional, Mapping, Any
+from typing import Optional, Mapping, Any, NamedTuple
 
 from aiogram.types import FSInputFile
 
 
-@dataclass(frozen=True)
-class Dimensions:
+class Dimensions(NamedTuple):
     width: int
     height: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventData:
     timestamp: str
     location: str
     audience: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NgoData:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardData:
     image: bytes
     title: str
@@ -38,12 +37,12 @@ class CardTemplate(StrEnum):
     WEBSITE = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenderParameters:
     template: CardTemplate
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptContext:
     """
     Структура данных контекста для промптов генерации контента.
@@ -127,7 +126,7 @@ class PromptContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanPromptContext:
     """
     Структура данных контекста для промптов планирования контента.
@@ -140,11 +139,13 @@ class PlanPromptContext:
         frequency (str): Частота публикаций
         themes (str): Темы контента
         details (str): Дополнительные детали
+        user_id (Optional[int]): Идентификатор пользователя-владельца плана
     """
     period: str = ""
     frequency: str = ""
     themes: str = ""
     details: str = ""
+    user_id: Optional[int] = None
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "PlanPromptContext":
@@ -165,7 +166,7 @@ class PlanPromptContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EditPromptContext:
     """
     Структура данных контекста для промптов редактирования текста.
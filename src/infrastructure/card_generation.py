@@ -9,12 +9,17 @@
 включая Telegram, ВКонтакте и веб-сайты.
 """
 
+import asyncio
 import logging
 import os
 import textwrap
+import threading
 from abc import ABC, abstractmethod
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, List
+from types import MappingProxyType
+from typing import Tuple, List, Mapping
 import re
 import io
 from PIL import Image, ImageDraw, ImageFont, ImageColor, ImageOps
@@ -23,6 +28,185 @@ from dtos import CardData, RenderParameters, Dimensions, CardTemplate
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1024)
+def _text_bbox(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+    """
+    Габариты текста с кэшированием.
+
+    Шрифты живут в кэше генератора все время работы, поэтому одинаковые
+    запросы метрик (высота строки, повторяющиеся подписи) не пересчитываются.
+    """
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """
+    Конвертация hex цвета в RGB с кэшированием.
+
+    Args:
+        hex_color (str): Цвет в hex формате (например, '#667eea')
+
+    Returns:
+        Tuple[int, int, int]: RGB кортеж
+    """
+    try:
+        return ImageColor.getrgb(hex_color)
+    except Exception as e:
+        logger.warning(f"Ошибка парсинга цвета {hex_color}: {e}")
+        return (102, 126, 234)  # default primary_color
+
+
+def _line_height(font: ImageFont.FreeTypeFont, spacing: int) -> int:
+    """
+    Высота строки шрифта с межстрочным отступом.
+
+    Высота берется по образцу "Ag", в котором есть и выносные элементы
+    над строкой, и под ней.
+    """
+    bbox = _text_bbox(font, "Ag")
+    return bbox[3] - bbox[1] + spacing
+
+
+def _wrap_by_width(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+    """
+    Жадный перенос текста по словам с учетом реальной ширины в пикселях.
+
+    Ширина каждого слова измеряется один раз, ширина строки накапливается.
+    Слово, которое шире max_width само по себе, разбивается по символам.
+    """
+    space_width = font.getlength(" ")
+    lines = []
+    current_words = []
+    current_width = 0.0
+
+    for word in text.split():
+        word_width = font.getlength(word)
+        if word_width > max_width:
+            # Длинное слово: выносим куски целиком заполненными строками,
+            # остаток продолжает текущую строку как обычное слово
+            if current_words:
+                lines.append(" ".join(current_words))
+                current_words = []
+                current_width = 0.0
+            chunk = ""
+            for char in word:
+                if chunk and font.getlength(chunk + char) > max_width:
+                    lines.append(chunk)
+                    chunk = ""
+                chunk += char
+            word = chunk
+            word_width = font.getlength(word)
+
+        if current_words and current_width + space_width + word_width > max_width:
+            lines.append(" ".join(current_words))
+            current_words = []
+            current_width = 0.0
+
+        current_width += (space_width if current_words else 0.0) + word_width
+        current_words.append(word)
+
+    if current_words:
+        lines.append(" ".join(current_words))
+
+    return lines
+
+
+# Токены markdown: **жирный**, *курсив* (не начинается с "**"),
+# одиночная звездочка без пары и обычный текст до следующей звездочки
+_MD_TOKEN_RE = re.compile(r'\*\*(.*?)\*\*|\*(?!\*)(.*?)\*|(\*)|([^*]+)', re.DOTALL)
+
+
+def _tokenize_markdown(text: str) -> List[Tuple[str, bool, bool]]:
+    """
+    Разбиение текста на токены простого Markdown.
+
+    Returns:
+        List[Tuple[str, bool, bool]]: Список кортежей (текст, жирный, курсив)
+    """
+    tokens = []
+    for bold_text, italic_text, lone_star, chunk in _MD_TOKEN_RE.findall(text):
+        if bold_text:
+            tokens.append((bold_text, True, False))
+        elif italic_text:
+            tokens.append((italic_text, False, True))
+        elif lone_star or chunk:
+            tokens.append((lone_star or chunk, False, False))
+    return tokens
+
+
+def _draw_building_icon(draw: ImageDraw.ImageDraw, x: float, y: float, size: int, color: Tuple[int, int, int]):
+    """Иконка НКО."""
+    draw.rectangle([x, y + size * 0.3, x + size, y + size], fill=color)
+    draw.polygon([x, y + size * 0.3, x + size / 2, y, x + size, y + size * 0.3], fill=color)
+
+
+def _draw_clock_icon(draw: ImageDraw.ImageDraw, x: float, y: float, size: int, color: Tuple[int, int, int]):
+    """Иконка времени."""
+    draw.ellipse([x, y, x + size, y + size], outline=color, width=2)
+    cx, cy = x + size / 2, y + size / 2
+    draw.line([cx, cy, cx, cy - size / 3], fill=color, width=2)
+    draw.line([cx, cy, cx + size / 3, cy], fill=color, width=2)
+
+
+def _draw_pin_icon(draw: ImageDraw.ImageDraw, x: float, y: float, size: int, color: Tuple[int, int, int]):
+    """Иконка локации."""
+    cx, cy = x + size / 2, y + size / 3
+    r = size / 2.5
+    draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=color)
+    draw.polygon([cx, cy + r, cx - r / 2, cy, cx + r / 2, cy], fill=color)
+    draw.ellipse([cx - r / 3, cy - r / 3, cx + r / 3, cy + r / 3], fill=(255, 255, 255))
+
+
+def _draw_people_icon(draw: ImageDraw.ImageDraw, x: float, y: float, size: int, color: Tuple[int, int, int]):
+    """Иконка аудитории."""
+    for offset in [0, size / 2]:
+        draw.ellipse([x + offset, y, x + size / 3 + offset, y + size / 3], fill=color)
+        draw.pieslice([x - size / 6 + offset, y + size / 3, x + size / 2 + offset, y + size], 270, 90,
+                      fill=color)
+
+
+# Функции отрисовки векторных иконок по их типу
+VECTOR_ICON_DRAWERS = {
+    'building': _draw_building_icon,
+    'clock': _draw_clock_icon,
+    'pin': _draw_pin_icon,
+    'people': _draw_people_icon,
+}
+
+
+# Максимальное количество карточек, рендерящихся одновременно
+MAX_CONCURRENT_RENDERS = min(4, os.cpu_count() or 2)
+
+# Максимальное количество градиентов в кэше генератора
+GRADIENT_CACHE_SIZE = 64
+
+# Уровень сжатия PNG для VK/website-карточек: быстрое сжатие zlib,
+# размер файла для отправки в мессенджер некритичен
+PNG_COMPRESS_LEVEL = 1
+
+# Непрозрачность темного оверлея под текстом VK/website-карточек (40%)
+OVERLAY_OPACITY = 102
+
+# Таблица затемнения канала с тем же округлением, что дает alpha_composite
+# черного оверлея поверх непрозрачного фона
+OVERLAY_DARKEN_LUT = tuple((value * (255 - OVERLAY_OPACITY) + 127) // 255 for value in range(256))
+
+# Размеры шрифтов Telegram-карточки
+TELEGRAM_TITLE_FONT_SIZE = 90
+TELEGRAM_PILL_FONT_SIZE = 32
+
+# Размеры шрифтов VK/website-карточек
+CARD_TITLE_FONT_SIZE = 48
+CARD_FOOTER_FONT_SIZE = 20
+
+# Размеры холста карточек по шаблонам
+CARD_DIMENSIONS: Mapping[CardTemplate, Dimensions] = MappingProxyType({
+    CardTemplate.TELEGRAM: Dimensions(width=1240, height=1754),  # A4 вертикально
+    CardTemplate.VK: Dimensions(width=1080, height=1528),
+    CardTemplate.WEBSITE: Dimensions(width=1080, height=1528),
+})
+
 
 class BaseCardGenerator(ABC):
     """
@@ -63,9 +247,36 @@ class PillowCardGenerator(BaseCardGenerator):
         # Кэш для шрифтов
         self.font_cache = {}
 
+        # Кэш отрисованных иконок: (тип, размер, цвет) -> RGBA-спрайт
+        self.icon_cache = {}
+
+        # Кэш скругленных краев плашек: (высота, цвет) -> (левый, правый) спрайты
+        self.pill_cap_cache = {}
+
+        # Кэш градиентов: (ширина, высота, начальный RGB, конечный RGB) -> изображение
+        self.gradient_cache = {}
+
+        # Рендеры идут в потоках asyncio.to_thread, поэтому чтение, вставка
+        # и вытеснение градиентов выполняются под блокировкой
+        self._gradient_cache_lock = threading.Lock()
+
+        # Кэш полупрозрачных подложек: (ширина, высота, RGBA) -> изображение
+        self.tile_cache = {}
+
+        # Ограничение на число одновременных рендеров, чтобы всплеск
+        # запросов не забирал все ядра и потоки пула
+        self._render_semaphore = asyncio.Semaphore(MAX_CONCURRENT_RENDERS)
+
         # Попытка загрузить шрифты из системы
         self._load_fonts()
 
+        # Заранее загружаем шрифты всех шаблонов, чтобы первый рендер
+        # не тратил время на чтение файлов шрифтов
+        self._get_font(TELEGRAM_TITLE_FONT_SIZE, bold=True)
+        self._get_font(TELEGRAM_PILL_FONT_SIZE, bold=False)
+        self._get_font(CARD_TITLE_FONT_SIZE, bold=True)
+        self._get_font(CARD_FOOTER_FONT_SIZE, bold=False)
+
         logger.info("PillowCardGenerator инициализирован")
 
     def _load_fonts(self):
@@ -144,22 +355,6 @@ class PillowCardGenerator(BaseCardGenerator):
 
         return self.font_cache[cache_key]
 
-    def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
-        """
-        Конвертация hex цвета в RGB.
-        
-        Args:
-            hex_color (str): Цвет в hex формате (например, '#667eea')
-            
-        Returns:
-            Tuple[int, int, int]: RGB кортеж
-        """
-        try:
-            return ImageColor.getrgb(hex_color)
-        except Exception as e:
-            logger.warning(f"Ошибка парсинга цвета {hex_color}: {e}")
-            return (102, 126, 234)  # default primary_color
-
     def _create_gradient_background(self, width: int, height: int, start_color: str, end_color: str) -> Image.Image:
         """
         Создание градиентного фона.
@@ -173,23 +368,36 @@ class PillowCardGenerator(BaseCardGenerator):
         Returns:
             Image.Image: Изображение с градиентом
         """
-        start_rgb = self._hex_to_rgb(start_color)
-        end_rgb = self._hex_to_rgb(end_color)
-
-        # Создание градиентного изображения
-        gradient = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(gradient)
-
+        start_rgb = _hex_to_rgb(start_color)[:3]
+        end_rgb = _hex_to_rgb(end_color)[:3]
+
+        # Ключ по разобранным цветам, чтобы '#667eea' и '#667EEA' совпадали
+        cache_key = (width, height, start_rgb, end_rgb)
+        with self._gradient_cache_lock:
+            cached = self.gradient_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
+        # Интерполяция цвета по вертикали считается один раз для столбца
+        # шириной 1 пиксель, затем столбец растягивается на всю ширину
+        column = bytearray()
         for y in range(height):
-            # Интерполяция цвета по вертикали
             ratio = y / max(height - 1, 1)
-            r = int(start_rgb[0] * (1 - ratio) + end_rgb[0] * ratio)
-            g = int(start_rgb[1] * (1 - ratio) + end_rgb[1] * ratio)
-            b = int(start_rgb[2] * (1 - ratio) + end_rgb[2] * ratio)
+            column.extend(
+                int(start * (1 - ratio) + end * ratio)
+                for start, end in zip(start_rgb, end_rgb)
+            )
+
+        gradient = Image.frombytes('RGB', (1, height), bytes(column))
+        gradient = gradient.resize((width, height), Image.Resampling.NEAREST)
 
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
+        with self._gradient_cache_lock:
+            # Вытесняем самый старый градиент при переполнении кэша
+            if cache_key not in self.gradient_cache and len(self.gradient_cache) >= GRADIENT_CACHE_SIZE:
+                self.gradient_cache.pop(next(iter(self.gradient_cache)))
+            self.gradient_cache[cache_key] = gradient
 
-        return gradient
+        return gradient.copy()
 
     def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
         """
@@ -206,34 +414,8 @@ class PillowCardGenerator(BaseCardGenerator):
         if not text:
             return ""
 
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            # Проверка ширины текущей линии с новым словом
-            test_line = current_line + (" " if current_line else "") + word
-            bbox = font.getbbox(test_line)
-            line_width = bbox[2] - bbox[0]
-
-            if line_width <= max_width and '\n' not in word:
-                current_line = test_line
-            else:
-                # Новая линия или перенос по слову
-                if current_line:
-                    lines.append(current_line)
-                if '\n' in word:
-                    # Разбиение слова с переносом
-                    word_parts = word.split('\n')
-                    current_line = word_parts[-1]  # Последняя часть - начало новой линии
-                    lines.extend(word_parts[:-1])  # Остальные части добавляем как отдельные линии
-                else:
-                    current_line = word
-
-        if current_line:
-            lines.append(current_line)
-
-        return '\n'.join(lines)
+        # Ширина каждого слова измеряется один раз, а не вся строка на каждом шаге
+        return '\n'.join(_wrap_by_width(text, font, max_width))
 
     def _safe_wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
         """
@@ -251,10 +433,8 @@ class PillowCardGenerator(BaseCardGenerator):
             return []
 
         # Использование textwrap для базового переноса
-        import textwrap
-
         # Приблизительный расчет ширины символа
-        avg_char_width = font.getbbox("W")[2] - font.getbbox("W")[0] + 2
+        avg_char_width = _text_bbox(font, "W")[2] - _text_bbox(font, "W")[0] + 2
         max_chars = max(1, int(max_width / avg_char_width))
 
         wrapped_lines = textwrap.wrap(text, width=max_chars)
@@ -265,7 +445,7 @@ class PillowCardGenerator(BaseCardGenerator):
 
         for line in wrapped_lines:
             # Проверка ширины каждой строки
-            bbox = font.getbbox(line)
+            bbox = _text_bbox(font, line)
             line_width = bbox[2] - bbox[0]
 
             if line_width <= max_width:
@@ -288,86 +468,6 @@ class PillowCardGenerator(BaseCardGenerator):
 
         return safe_lines
 
-    def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
-        """Перенос текста по словам с учетом максимальной ширины."""
-        if not text:
-            return ""
-
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            # Проверяем ширину текущей линии с новым словом
-            test_line = current_line + (" " if current_line else "") + word
-            bbox = font.getbbox(test_line)
-            line_width = bbox[2] - bbox[0]
-
-            if line_width <= max_width and '\n' not in word:
-                current_line = test_line
-            else:
-                # Новая линия или перенос по слову
-                if current_line:
-                    lines.append(current_line)
-                if '\n' in word:
-                    # Разбиваем слово с переносом
-                    word_parts = word.split('\n')
-                    current_line = word_parts[-1]  # Последняя часть - начало новой линии
-                    lines.extend(word_parts[:-1])  # Остальные части добавляем как отдельные линии
-                else:
-                    current_line = word
-
-        if current_line:
-            lines.append(current_line)
-
-        return '\n'.join(lines)
-
-    def _safe_wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
-        """Безопасный перенос текста с гарантией, что ни одна строка не выйдет за max_width.
-
-        Возвращает список строк, каждая из которых гарантированно помещается по ширине.
-        """
-        if not text:
-            return []
-
-        # Сначала используем textwrap для базового переноса
-        import textwrap
-
-        # Приблизительный расчет ширины символа для textwrap (усредненный)
-        avg_char_width = font.getbbox("W")[2] - font.getbbox("W")[0] + 2
-        max_chars = max(1, int(max_width / avg_char_width))
-
-        wrapped_lines = textwrap.wrap(text, width=max_chars)
-        if not wrapped_lines:
-            return []
-
-        safe_lines = []
-
-        for line in wrapped_lines:
-            # Последняя проверка ширины каждой строки
-            bbox = font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
-
-            if line_width <= max_width:
-                safe_lines.append(line)
-            else:
-                # Если строка все равно слишком широкая, режем ее посимвольно
-                current_line = ""
-                for char in line:
-                    test_line = current_line + char
-                    bbox = font.getbbox(test_line)
-                    if bbox[2] - bbox[0] <= max_width - 4:  # -4 для запаса
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            safe_lines.append(current_line)
-                        current_line = char
-
-                if current_line:
-                    safe_lines.append(current_line)
-
-        return safe_lines
-
     def _format_markdown_text_telegram(self, text: str, base_font: ImageFont.FreeTypeFont, max_width: int) -> List[Tuple[str, bool, bool]]:
         """Парсинг простого Markdown текста для Telegram-карточек.
 
@@ -384,42 +484,8 @@ class PillowCardGenerator(BaseCardGenerator):
         text = re.sub(r'\*\*\*(.+?)\*\*\*', r'\*\*\1\*', text)  # ***text*** -> **text*
         text = re.sub(r'___(.+?)___', r'\*\*\1\*', text)        # ___text___ -> **text*
 
-        # Разбиваем на токены по правилам markdown
-        tokens = []
-        i = 0
-        while i < len(text):
-            if text[i:i+2] == '**':
-                # Найдем конец bold текста
-                end = text.find('**', i+2)
-                if end != -1:
-                    bold_text = text[i+2:end]
-                    if bold_text:
-                        tokens.append((bold_text, True, False))  # bold
-                    i = end + 2
-                else:
-                    # Не найден закрывающий маркер, добавляем как обычный текст
-                    tokens.append((text[i], False, False))
-                    i += 1
-            elif text[i] == '*':
-                # Найдем конец italic текста
-                end = text.find('*', i+1)
-                if end != -1:
-                    italic_text = text[i+1:end]
-                    if italic_text:
-                        tokens.append((italic_text, False, True))  # italic (пока без курсива)
-                    i = end + 1
-                else:
-                    # Не найден закрывающий маркер, добавляем как обычный текст
-                    tokens.append((text[i], False, False))
-                    i += 1
-            else:
-                # Обычный текст - собираем до следующего маркера
-                chunk = ""
-                while i < len(text) and text[i:i+2] != '**' and text[i] != '*':
-                    chunk += text[i]
-                    i += 1
-                if chunk:
-                    tokens.append((chunk, False, False))  # regular
+        # Разбиение на токены одним проходом регулярного выражения
+        tokens = _tokenize_markdown(text)
 
         # Теперь переносим по ширине и сохраняем форматирование
         formatted_tokens = []
@@ -433,7 +499,7 @@ class PillowCardGenerator(BaseCardGenerator):
             for word in words:
                 # Проверяем ширину слова
                 font = self._get_font(base_font.size, is_bold) if is_bold else base_font
-                word_bbox = font.getbbox(word)
+                word_bbox = _text_bbox(font, word)
                 word_width = word_bbox[2] - word_bbox[0]
 
                 # Проверяем помещается ли слово в текущую строку
@@ -455,165 +521,9 @@ class PillowCardGenerator(BaseCardGenerator):
 
         return formatted_tokens
 
-    def _draw_multiline_text(self, draw: ImageDraw.ImageDraw, text: str, position: Tuple[int, int],
-                           font: ImageFont.FreeTypeFont, fill: Tuple[int, int, int],
-                           anchor: str = "lt", align: str = "left"):
-        """Отрисовка многострочного текста."""
-        if not text:
-            return
-
-        x, y = position
-        lines = text.split('\n')
-        line_height = font.getbbox("Ag")[3] - font.getbbox("Ag")[1] + 4  # Высота линии
-
-        for line in lines:
-            if not line.strip():
-                y += line_height
-                continue
-
-            # Позиционирование в зависимости от anchor
-            if anchor == "mm":  # middle middle
-                bbox = font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                text_x = x - text_width // 2
-                text_y = y - line_height // 2
-            elif anchor == "mt":  # middle top
-                bbox = font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                text_x = x - text_width // 2
-                text_y = y
-            else:  # left top (lt)
-                text_x, text_y = x, y
-
-            draw.text((text_x, text_y), line, font=font, fill=fill)
-            y += line_height
-
-    def _format_markdown_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[Tuple[str, bool, bool]]:
-        """Парсинг простого Markdown текста и форматирование с переносами.
-
-        Поддерживает:
-        - **bold** текст
-        - *italic* текст (пока не реализовано в PIL, но можно добавить курсивный шрифт)
-
-        Возвращает список кортежей: (text_chunk, is_bold, is_italic)
-        """
-        if not text:
-            return []
-
-        # Удаляем старые маркеры форматирования рекурсивно
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'\*\*\1\*', text)  # ***text*** -> **text*
-        text = re.sub(r'___(.+?)___', r'\*\*\1\*', text)        # ___text___ -> **text*
-
-        # Разбиваем на токены по правилам markdown
-        tokens = []
-        i = 0
-        while i < len(text):
-            if text[i:i+2] == '**':
-                # Найдем конец bold текста
-                end = text.find('**', i+2)
-                if end != -1:
-                    bold_text = text[i+2:end]
-                    if bold_text:
-                        tokens.append((bold_text, True, False))  # bold
-                    i = end + 2
-                else:
-                    # Не найден закрывающий маркер, добавляем как обычный текст
-                    tokens.append((text[i], False, False))
-                    i += 1
-            elif text[i] == '*':
-                # Найдем конец italic текста
-                end = text.find('*', i+1)
-                if end != -1:
-                    italic_text = text[i+1:end]
-                    if italic_text:
-                        tokens.append((italic_text, False, True))  # italic (пока без курсива)
-                    i = end + 1
-                else:
-                    # Не найден закрывающий маркер, добавляем как обычный текст
-                    tokens.append((text[i], False, False))
-                    i += 1
-            else:
-                # Обычный текст - собираем до следующего маркера
-                chunk = ""
-                while i < len(text) and text[i:i+2] != '**' and text[i] != '*':
-                    chunk += text[i]
-                    i += 1
-                if chunk:
-                    tokens.append((chunk, False, False))  # regular
-
-        # Теперь переносим по ширине и сохраняем форматирование
-        formatted_lines = []
-        current_line = []
-        current_width = 0
-
-        for token_text, is_bold, is_italic in tokens:
-            # Разбиваем токен на слова
-            words = token_text.split()
-
-            for word in words:
-                # Проверяем ширину слова
-                test_font = self._get_font(font.size, is_bold)  # Используем bold шрифт если нужно
-                word_bbox = test_font.getbbox(word)
-                word_width = word_bbox[2] - word_bbox[0]
-
-                # Проверяем помещается ли слово в текущую строку
-                if current_width + word_width <= max_width or not current_line:
-                    current_line.append((word, is_bold, is_italic))
-                    current_width += word_width + 4  # + отступ между словами
-                else:
-                    # Переходим на новую строку
-                    if current_line:
-                        formatted_lines.extend(current_line)
-                        formatted_lines.append(('\n', False, False))  # маркер новой строки
-
-                    current_line = [(word, is_bold, is_italic)]
-                    current_width = word_width
-
-        # Добавляем последнюю строку
-        if current_line:
-            formatted_lines.extend(current_line)
-
-        return formatted_lines
-
-    def _draw_formatted_multiline_text(self, draw: ImageDraw.ImageDraw,
-                                     formatted_tokens: List[Tuple[str, bool, bool]],
-                                     position: Tuple[int, int],
-                                     base_font: ImageFont.FreeTypeFont,
-                                     base_color: Tuple[int, int, int]):
-        """Отрисовка форматированного текста с поддержкой bold/italic."""
-        x, y = position
-        line_height = base_font.getbbox("Ag")[3] - base_font.getbbox("Ag")[1] + 6
-
-        current_x = x
-
-        for token_text, is_bold, is_italic in formatted_tokens:
-            if token_text == '\n':
-                # Новая строка
-                current_x = x
-                y += line_height
-                continue
-
-            # Выбираем шрифт
-            font = self._get_font(base_font.size, is_bold)
-
-            # Рисуем токен
-            draw.text((current_x, y), token_text, font=font, fill=base_color)
-
-            # Сдвигаем позицию
-            bbox = font.getbbox(token_text)
-            current_x += bbox[2] - bbox[0] + 4  # + отступ между словами
-
     def _create_telegram_gradient(self, width, height, color1, color2):
         """Создает горизонтальный градиент для Telegram-карточек."""
-        base = Image.new('RGB', (width, height), color1)
-        top = Image.new('RGB', (width, height), color2)
-        mask = Image.new('L', (width, height))
-        mask_data = []
-        for y in range(height):
-            mask_data.extend([int(255 * (x / width)) for x in range(width)])
-        mask.putdata(mask_data)
-        base.paste(top, (0, 0), mask)
-        return base
+        return self._create_horizontal_gradient(width, height, color1, color2)
 
     def _draw_telegram_icon(self, draw, icon_type, x, y, size, color):
         """Рисует схематичные иконки для Telegram."""
@@ -665,7 +575,7 @@ class PillowCardGenerator(BaseCardGenerator):
         icon_padding = 10
 
         # Считаем размеры текста
-        bbox = font.getbbox(text)
+        bbox = _text_bbox(font, text)
         text_w = bbox[2] - bbox[0]
         text_h = bbox[3] - bbox[1]
 
@@ -691,8 +601,6 @@ class PillowCardGenerator(BaseCardGenerator):
 
     def _format_telegram_datetime(self, event_datetime):
         """Форматирует дату и время в читаемый формат для Telegram: '15 декабря 2025, 14:00'"""
-        from datetime import datetime
-
         # Названия месяцев на русском
         months_ru = {
             1: "января", 2: "февраля", 3: "марта", 4: "апреля", 5: "мая", 6: "июня",
@@ -787,59 +695,88 @@ class PillowCardGenerator(BaseCardGenerator):
         """
         Создание горизонтального градиента (слева направо).
         """
-        base = Image.new('RGB', (width, height), color1_rgb)
-        top = Image.new('RGB', (width, height), color2_rgb)
-        mask = Image.new('L', (width, height))
-        mask_data = []
-
-        # Генерация маски градиента по горизонтали
-        for y in range(height):
-            # Вся строка одинаковая, меняется по X
-            row = [int(255 * (x / width)) for x in range(width)]
-            mask_data.extend(row)
-
-        mask.putdata(mask_data)
-        base.paste(top, (0, 0), mask)
-        return base
+        # Все строки градиента одинаковые, меняется только X: смешиваем цвета
+        # для одной строки в целых числах и растягиваем ее по высоте
+        # (NEAREST копирует строку без интерполяции)
+        row = bytearray()
+        for x in range(width):
+            alpha = 255 * x // width
+            for c1, c2 in zip(color1_rgb, color2_rgb):
+                row.append((c1 * (255 - alpha) + c2 * alpha + 127) // 255)
+
+        gradient_row = Image.frombytes('RGB', (width, 1), bytes(row))
+        return gradient_row.resize((width, height), Image.Resampling.NEAREST)
 
     def _draw_vector_icon(self, draw: ImageDraw.ImageDraw, icon_type: str, x: float, y: float, size: int,
                           color: Tuple[int, int, int]):
         """
         Отрисовка векторных иконок программно (без загрузки внешних файлов).
         """
-        if icon_type == 'building':  # НКО
-            draw.rectangle([x, y + size * 0.3, x + size, y + size], fill=color)
-            draw.polygon([x, y + size * 0.3, x + size / 2, y, x + size, y + size * 0.3], fill=color)
-
-        elif icon_type == 'clock':  # Время
-            draw.ellipse([x, y, x + size, y + size], outline=color, width=2)
-            cx, cy = x + size / 2, y + size / 2
-            draw.line([cx, cy, cx, cy - size / 3], fill=color, width=2)
-            draw.line([cx, cy, cx + size / 3, cy], fill=color, width=2)
-
-        elif icon_type == 'pin':  # Локация
-            cx, cy = x + size / 2, y + size / 3
-            r = size / 2.5
-            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=color)
-            draw.polygon([cx, cy + r, cx - r / 2, cy, cx + r / 2, cy], fill=color)
-            draw.ellipse([cx - r / 3, cy - r / 3, cx + r / 3, cy + r / 3], fill=(255, 255, 255))
-
-        elif icon_type == 'people':  # Аудитория
-            for offset in [0, size / 2]:
-                draw.ellipse([x + offset, y, x + size / 3 + offset, y + size / 3], fill=color)
-                draw.pieslice([x - size / 6 + offset, y + size / 3, x + size / 2 + offset, y + size], 270, 90,
-                              fill=color)
-
-    def _draw_pill(self, img: Image.Image, text: str, icon_type: str, font: ImageFont.FreeTypeFont,
-                   x: int, y: int, align: str = 'left') -> int:
+        drawer = VECTOR_ICON_DRAWERS.get(icon_type)
+        if drawer:
+            drawer(draw, x, y, size, color)
+
+    def _get_icon_sprite(self, icon_type: str, size: int, color: Tuple[int, int, int]) -> Image.Image:
+        """
+        Получение иконки в виде RGBA-спрайта из кэша или ее отрисовка.
+
+        Вокруг иконки оставляется прозрачное поле в половину размера, так как
+        некоторые фигуры (например, 'people') выходят за пределы квадрата size x size.
+        """
+        cache_key = (icon_type, size, color)
+
+        if cache_key not in self.icon_cache:
+            pad = size // 2
+            sprite = Image.new('RGBA', (size + pad * 2, size + pad * 2), (0, 0, 0, 0))
+            self._draw_vector_icon(ImageDraw.Draw(sprite), icon_type, pad, pad, size, color)
+            self.icon_cache[cache_key] = sprite
+
+        return self.icon_cache[cache_key]
+
+    def _get_pill_caps(self, height: int, color: Tuple[int, int, int]) -> Tuple[Image.Image, Image.Image]:
+        """
+        Получение левого и правого скругленных краев плашки из кэша или их отрисовка.
+
+        Края вырезаются из круга диаметром height, поэтому плашка любой ширины
+        собирается из двух спрайтов и прямоугольника между ними.
+        """
+        cache_key = (height, color)
+
+        if cache_key not in self.pill_cap_cache:
+            circle = Image.new('RGBA', (height + 1, height + 1), (0, 0, 0, 0))
+            ImageDraw.Draw(circle).rounded_rectangle([(0, 0), (height, height)], radius=height / 2, fill=color)
+            half = (height + 1) // 2
+            self.pill_cap_cache[cache_key] = (
+                circle.crop((0, 0, half, height + 1)),
+                circle.crop((height + 1 - half, 0, height + 1, height + 1)),
+            )
+
+        return self.pill_cap_cache[cache_key]
+
+    def _get_tile(self, width: int, height: int, color: Tuple[int, int, int, int]) -> Image.Image:
+        """
+        Получение однотонной полупрозрачной подложки из кэша или ее создание.
+
+        Подложки не изменяются после создания, поэтому одна и та же
+        накладывается во всех карточках без копирования.
+        """
+        cache_key = (width, height, color)
+
+        if cache_key not in self.tile_cache:
+            self.tile_cache[cache_key] = Image.new('RGBA', (width, height), color)
+
+        return self.tile_cache[cache_key]
+
+    def _draw_pill(self, img: Image.Image, draw: ImageDraw.ImageDraw, text: str, icon_type: str,
+                   font: ImageFont.FreeTypeFont, x: int, y: int, align: str = 'left') -> int:
         """
         Рисует скругленную плашку ("пилюлю") с текстом и иконкой.
+        Использует переданный объект ImageDraw холста img.
         Возвращает Y-координату нижней границы плашки (для отступов).
         """
         if not text:
             return y
 
-        draw = ImageDraw.Draw(img)
         text_color = (0, 0, 0)
         bg_color = (255, 255, 255)
 
@@ -848,7 +785,7 @@ class PillowCardGenerator(BaseCardGenerator):
         icon_size = 35
         icon_padding = 15
 
-        bbox = font.getbbox(text)
+        bbox = _text_bbox(font, text)
         text_w = bbox[2] - bbox[0]
         text_h = bbox[3] - bbox[1]
 
@@ -860,13 +797,19 @@ class PillowCardGenerator(BaseCardGenerator):
         if align == 'right':
             start_x = x - full_w
 
-        # Фон
-        draw.rounded_rectangle([(start_x, y), (start_x + full_w, y + full_h)], radius=full_h / 2, fill=bg_color)
+        # Фон: скругленные края из кэша и прямоугольник между ними
+        left_cap, right_cap = self._get_pill_caps(full_h, bg_color)
+        cap_w = left_cap.width
+        img.paste(left_cap, (start_x, y), left_cap)
+        img.paste(right_cap, (start_x + full_w + 1 - cap_w, y), right_cap)
+        draw.rectangle([(start_x + cap_w, y), (start_x + full_w - cap_w, y + full_h)], fill=bg_color)
 
         # Иконка
         icon_x = start_x + padding_x
         icon_y = y + (full_h - icon_size) / 2
-        self._draw_vector_icon(draw, icon_type, icon_x, icon_y, icon_size, text_color)
+        sprite = self._get_icon_sprite(icon_type, icon_size, text_color)
+        pad = icon_size // 2
+        img.paste(sprite, (round(icon_x) - pad, round(icon_y) - pad), sprite)
 
         # Текст (центрирование по вертикали)
         text_x = icon_x + icon_size + icon_padding
@@ -875,32 +818,39 @@ class PillowCardGenerator(BaseCardGenerator):
 
         return y + full_h + 20  # Возвращаем Y + отступ
 
-    async def _render_telegram_card(self, data: CardData) -> bytes:
+    def _render_telegram_card(self, data: CardData) -> bytes:
         """
         Реализация генерации карточки (формат A4 Vertical).
         """
         # 1. Настройки холста (A4 Vertical approx: 1240x1754 px)
-        W, H = 1240, 1754
+        W, H = CARD_DIMENSIONS[CardTemplate.TELEGRAM]
 
         # Цвета для градиента (Маджента -> Персиковый)
         color_magenta = (225, 70, 220)
         color_peach = (255, 220, 160)
 
         # Получаем шрифты через кэш класса
-        font_title = self._get_font(90, bold=True)
-        font_pill = self._get_font(32, bold=False)
+        font_title = self._get_font(TELEGRAM_TITLE_FONT_SIZE, bold=True)
+        font_pill = self._get_font(TELEGRAM_PILL_FONT_SIZE, bold=False)
 
-        # Создаем базовый холст
-        img = Image.new('RGB', (W, H), (255, 255, 255))
+        # Создаем базовый холст сразу из горизонтального градиента: верхнюю часть
+        # затем перекрывает изображение, а нижняя остается градиентом
+        img = self._create_horizontal_gradient(W, H, color_magenta, color_peach)
 
         # 2. Обработка изображения (Верхние 60%)
         split_y = int(H * 0.60)
 
         try:
             if data.image:
-                user_img = Image.open(io.BytesIO(data.image)).convert('RGB')
-                # Smart crop / Resize
-                user_img = ImageOps.fit(user_img, (W, split_y), method=Image.Resampling.LANCZOS)
+                user_img = Image.open(io.BytesIO(data.image))
+                # Для JPEG декодируем сразу в уменьшенном масштабе, но не меньше
+                # нужного размера (для остальных форматов draft ничего не делает)
+                user_img.draft('RGB', (W, split_y))
+                if user_img.mode != 'RGB':
+                    user_img = user_img.convert('RGB')
+                # Smart crop / Resize, если изображение еще не нужного размера
+                if user_img.size != (W, split_y):
+                    user_img = ImageOps.fit(user_img, (W, split_y), method=Image.Resampling.LANCZOS)
                 img.paste(user_img, (0, 0))
             else:
                 raise ValueError("Нет данных изображения")
@@ -911,41 +861,36 @@ class PillowCardGenerator(BaseCardGenerator):
             draw_ph.rectangle([(0, 0), (W, split_y)], fill=(0, 255, 0))
             draw_ph.text((W / 2 - 150, split_y / 2), "NO IMAGE", font=font_title, fill=(255, 255, 255))
 
-        # 3. Нижний горизонтальный градиент
-        grad_h = H - split_y
-        gradient = self._create_horizontal_gradient(W, grad_h, color_magenta, color_peach)
-        img.paste(gradient, (0, split_y))
-
         draw = ImageDraw.Draw(img)
 
-        # 4. Верхние "плашки" (НКО и Дата)
+        # 3. Верхние "плашки" (НКО и Дата)
         margin = 50
         top_pill_y = 50
 
         # Слева: НКО
         if data.ngo_data and data.ngo_data.name:
-            self._draw_pill(img, f"НКО «{data.ngo_data.name}»", 'building', font_pill, x=margin, y=top_pill_y,
+            self._draw_pill(img, draw, f"НКО «{data.ngo_data.name}»", 'building', font_pill, x=margin, y=top_pill_y,
                             align='left')
 
         # Справа: Дата и время (из EventData)
         if data.event_data and data.event_data.timestamp:
-            self._draw_pill(img, data.event_data.timestamp, 'clock', font_pill, x=W - margin, y=top_pill_y,
+            self._draw_pill(img, draw, data.event_data.timestamp, 'clock', font_pill, x=W - margin, y=top_pill_y,
                             align='right')
 
-        # 5. Основной контент (Нижняя часть)
+        # 4. Основной контент (Нижняя часть)
         content_y = split_y + 80
         left_margin = 60
 
         # Заголовок (UPPERCASE, с переносом)
         if data.title:
             title_text = data.title.upper()
-            # Используем встроенный textwrap, так как ширина шрифта переменная
-            # Подбираем width (кол-во символов) эмпирически для размера шрифта 90
-            lines = textwrap.wrap(title_text, width=16)
+            # Переносим по реальной ширине текста: шрифт пропорциональный,
+            # поэтому ограничение по количеству символов неточное
+            lines = _wrap_by_width(title_text, font_title, W - left_margin * 2)
 
             for line in lines:
                 draw.text((left_margin, content_y), line, font=font_title, fill=(255, 255, 255))
-                bbox = font_title.getbbox(line)
+                bbox = _text_bbox(font_title, line)
                 content_y += (bbox[3] - bbox[1]) + 20
 
         content_y += 30  # Отступ перед нижними плашками
@@ -954,15 +899,16 @@ class PillowCardGenerator(BaseCardGenerator):
         if data.event_data:
             # Локация
             if data.event_data.location:
-                content_y = self._draw_pill(img, data.event_data.location, 'pin', font_pill, x=left_margin, y=content_y,
+                content_y = self._draw_pill(img, draw, data.event_data.location, 'pin', font_pill,
+                                            x=left_margin, y=content_y,
                                             align='left')
 
             # Аудитория
             if data.event_data.audience:
                 text_aud = f"Для: {data.event_data.audience}"
-                self._draw_pill(img, text_aud, 'people', font_pill, x=left_margin, y=content_y, align='left')
+                self._draw_pill(img, draw, text_aud, 'people', font_pill, x=left_margin, y=content_y, align='left')
 
-        # 6. Сохранение в байты
+        # 5. Сохранение в байты
         output = io.BytesIO()
         img.save(output, format='JPEG', quality=95)
         return output.getvalue()
@@ -974,6 +920,27 @@ class PillowCardGenerator(BaseCardGenerator):
     ) -> bytes:
         """
         Генерация карточки с помощью Pillow.
+
+        Отрисовка полностью синхронная и нагружает CPU, поэтому выполняется
+        в отдельном потоке, чтобы не блокировать event loop бота.
+
+        Args:
+            parameters (RenderParameters): Параметры для генерации
+            data (CardData): Данные для карточки
+
+        Returns:
+            bytes: Изображение карточки
+        """
+        async with self._render_semaphore:
+            return await asyncio.to_thread(self._render_card_sync, parameters, data)
+
+    def _render_card_sync(
+        self,
+        parameters: RenderParameters,
+        data: CardData,
+    ) -> bytes:
+        """
+        Синхронная генерация карточки с помощью Pillow.
         
         Создает карточку программно, поддерживает:
         - Стандартные карточки с градиентами и текстом
@@ -998,49 +965,50 @@ class PillowCardGenerator(BaseCardGenerator):
 
             logger.info(f"Генерация карточки PIL.")
 
-            # FIXME: размер захарддкожен
-            width = 1080
-            height = 1528
-
             if parameters.template == CardTemplate.TELEGRAM:
-                return await self._render_telegram_card(
+                return self._render_telegram_card(
                     data
                 )
 
-            # Создание основного изображения
-            img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-            draw = ImageDraw.Draw(img)
-
-            # 1. ФОН - Градиент или фоновое изображение
-            gradient_bg = self._create_gradient_background(
-                width, height,
-                '#667eea',
-                '#764ba2',
-            )
-
-            # Наложение фонового изображения на градиент
-            img.paste(gradient_bg)
+            width, height = CARD_DIMENSIONS[parameters.template]
 
-            # Обработка фонового изображения из bytes
+            # 1. ФОН - фоновое изображение поверх градиента
             background_img = Image.open(io.BytesIO(data.image))
 
-            # Проверка формата и конверсия в RGBA если нужно
-            if background_img.mode != 'RGBA':
-                background_img = background_img.convert('RGBA')
+            # Для JPEG декодируем сразу в уменьшенном масштабе, но не меньше
+            # нужного размера (для остальных форматов draft ничего не делает)
+            background_img.draft('RGB', (width, height))
 
-            # Изменение размера фонового изображения под размеры карточки
-            background_img = background_img.resize((width, height), Image.Resampling.LANCZOS)
+            has_alpha = background_img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in background_img.info
 
-            # Наложение фонового изображения
-            img.paste(background_img, (0, 0), background_img)
+            # Холст карточки непрозрачный, поэтому работаем в RGB, а
+            # полупрозрачные элементы накладываем через их альфа-канал как маску
+            if has_alpha:
+                # Полупрозрачный фон накладывается на градиент
+                img = self._create_gradient_background(
+                    width, height,
+                    '#667eea',
+                    '#764ba2',
+                )
+                background_img = background_img.convert('RGBA')
+                if background_img.size != (width, height):
+                    background_img = background_img.resize((width, height), Image.Resampling.LANCZOS)
+                img.paste(background_img, (0, 0), background_img)
+            else:
+                # Непрозрачный фон целиком закрывает градиент, поэтому градиент
+                # не строится, а изображение само становится холстом
+                if background_img.mode != 'RGB':
+                    background_img = background_img.convert('RGB')
+                if background_img.size != (width, height):
+                    background_img = background_img.resize((width, height), Image.Resampling.LANCZOS)
+                img = background_img
+
+            # Затемнение фона для читаемости текста: холст непрозрачен, поэтому
+            # черный оверлей сводится к таблице по цветовым каналам
+            img = img.point(OVERLAY_DARKEN_LUT * 3)
 
             logger.info(f"Фоновое изображение наложено: {background_img.size}")
 
-
-            # Создание темного оверлея для читаемости текста (40% opacity)
-            overlay = Image.new('RGBA', (width, height), (0, 0, 0, 102))
-            img = Image.alpha_composite(img, overlay)
-
             draw = ImageDraw.Draw(img)
 
             # 2. Основная карточка (центрированная белая область)
@@ -1050,9 +1018,9 @@ class PillowCardGenerator(BaseCardGenerator):
             card_y = (height - card_height) // 2
 
             # Рисование закругленного прямоугольника (белый с тенью)
-            card_bg = Image.new('RGBA', (card_width, card_height), (255, 255, 255, 230))
+            card_bg = self._get_tile(card_width, card_height, (255, 255, 255, 230))
             # Простая тень
-            shadow = Image.new('RGBA', (card_width + 4, card_height + 4), (0, 0, 0, 50))
+            shadow = self._get_tile(card_width + 4, card_height + 4, (0, 0, 0, 50))
             img.paste(shadow, (card_x - 2, card_y - 2), shadow)
             img.paste(card_bg, (card_x, card_y), card_bg)
 
@@ -1066,9 +1034,9 @@ class PillowCardGenerator(BaseCardGenerator):
 
             # 3. ЗАГОЛОВОК
             if data.title:
-                title_font = self._get_font(48, bold=True)
+                title_font = self._get_font(CARD_TITLE_FONT_SIZE, bold=True)
                 title_lines = self._wrap_text(data.title, title_font, content_width)
-                title_color = self._hex_to_rgb('#667eea')
+                title_color = _hex_to_rgb('#667eea')
 
                 self._draw_multiline_text(
                     draw, title_lines,
@@ -1076,15 +1044,14 @@ class PillowCardGenerator(BaseCardGenerator):
                     title_font, title_color
                 )
 
-                bbox = title_font.getbbox("Ag")
-                title_height = (title_lines.count('\n') + 1) * (bbox[3] - bbox[1] + 10)
+                title_height = (title_lines.count('\n') + 1) * _line_height(title_font, 10)
                 current_y += title_height + 15
 
             # # 5. ОСНОВНОЙ КОНТЕНТ с поддержкой Markdown
             # if template_data.get('content'):
             #     content_font = self._get_font(24)
             #     content_lines = self._format_markdown_text(template_data['content'], content_font, content_width)
-            #     content_color = self._hex_to_rgb(template_data['text_color'])
+            #     content_color = _hex_to_rgb(template_data['text_color'])
             #
             #     self._draw_formatted_multiline_text(
             #         draw, content_lines,
@@ -1097,16 +1064,15 @@ class PillowCardGenerator(BaseCardGenerator):
 
 
             # 8. FOOTER
-            footer_font = self._get_font(20)
-            footer_color = self._hex_to_rgb('#667eea')
+            footer_font = self._get_font(CARD_FOOTER_FONT_SIZE)
+            footer_color = _hex_to_rgb('#667eea')
             footer_text = data.ngo_data.name
 
 
             footer_lines = self._wrap_text(footer_text, footer_font, content_width)
 
             # Позиция футера - внизу карточки
-            bbox = footer_font.getbbox("Ag")
-            footer_height = (footer_lines.count('\n') + 1) * (bbox[3] - bbox[1] + 4)
+            footer_height = (footer_lines.count('\n') + 1) * _line_height(footer_font, 4)
             footer_y = round((card_y + card_height - footer_height - 15))
 
             footer_x = content_x + content_width // 2
@@ -1116,9 +1082,8 @@ class PillowCardGenerator(BaseCardGenerator):
             )
 
             # Конвертирование в bytes
-            from io import BytesIO
-            output = BytesIO()
-            img.save(output, format='PNG')
+            output = io.BytesIO()
+            img.save(output, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
             card_bytes = output.getvalue()
 
             logger.info(f"Карточка PIL успешно сгенерирована: {len(card_bytes)} байт")
@@ -1147,30 +1112,23 @@ class PillowCardGenerator(BaseCardGenerator):
             return
 
         x, y = position
-        lines = text.split('\n')
-        line_height = font.getbbox("Ag")[3] - font.getbbox("Ag")[1] + 4
+        line_height = _line_height(font, 4)
 
-        for line in lines:
-            if not line.strip():
-                y += line_height
-                continue
+        # Интервал между строками для multiline_text: Pillow отсчитывает
+        # шаг строки от нижней границы "A", а не от высоты "Ag"
+        spacing = line_height - _text_bbox(font, "A")[3]
 
-            # Позиционирование в зависимости от anchor
-            if anchor == "mm":  # middle middle
-                bbox = font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                text_x = x - text_width // 2
-                text_y = y - line_height // 2
-            elif anchor == "mt":  # middle top
-                bbox = font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                text_x = x - text_width // 2
-                text_y = y
-            else:  # left top (lt)
-                text_x, text_y = x, y
-
-            draw.text((text_x, text_y), line, font=font, fill=fill)
-            y += line_height
+        if anchor == "mm":  # middle middle
+            y -= line_height // 2
+
+        # Все строки раскладываются и рисуются одним вызовом внутри Pillow
+        centered = anchor in ("mm", "mt")
+        draw.multiline_text(
+            (x, y), text, font=font, fill=fill,
+            anchor="ma" if centered else "la",
+            spacing=spacing,
+            align="center" if centered else align,
+        )
 
     def _format_markdown_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[Tuple[str, bool, bool]]:
         """
@@ -1195,40 +1153,8 @@ class PillowCardGenerator(BaseCardGenerator):
         text = re.sub(r'\*\*\*(.+?)\*\*\*', r'\*\*\1\*', text)  # ***text*** -> **text*
         text = re.sub(r'___(.+?)___', r'\*\*\1\*', text)        # ___text___ -> **text*
 
-        # Разбиение на токены по правилам markdown
-        tokens = []
-        i = 0
-        while i < len(text):
-            if text[i:i+2] == '**':
-                # Поиск конца bold текста
-                end = text.find('**', i+2)
-                if end != -1:
-                    bold_text = text[i+2:end]
-                    if bold_text:
-                        tokens.append((bold_text, True, False))  # bold
-                    i = end + 2
-                else:
-                    tokens.append((text[i], False, False))
-                    i += 1
-            elif text[i] == '*':
-                # Поиск конца italic текста
-                end = text.find('*', i+1)
-                if end != -1:
-                    italic_text = text[i+1:end]
-                    if italic_text:
-                        tokens.append((italic_text, False, True))  # italic
-                    i = end + 1
-                else:
-                    tokens.append((text[i], False, False))
-                    i += 1
-            else:
-                # Обычный текст
-                chunk = ""
-                while i < len(text) and text[i:i+2] != '**' and text[i] != '*':
-                    chunk += text[i]
-                    i += 1
-                if chunk:
-                    tokens.append((chunk, False, False))
+        # Разбиение на токены одним проходом регулярного выражения
+        tokens = _tokenize_markdown(text)
 
         # Перенос по ширине с сохранением форматирования
         formatted_lines = []
@@ -1240,7 +1166,7 @@ class PillowCardGenerator(BaseCardGenerator):
 
             for word in words:
                 test_font = self._get_font(font.size, is_bold)
-                word_bbox = test_font.getbbox(word)
+                word_bbox = _text_bbox(test_font, word)
                 word_width = word_bbox[2] - word_bbox[0]
 
                 if current_width + word_width <= max_width or not current_line:
@@ -1275,7 +1201,7 @@ class PillowCardGenerator(BaseCardGenerator):
             base_color (Tuple[int, int, int]): Базовый цвет
         """
         x, y = position
-        line_height = base_font.getbbox("Ag")[3] - base_font.getbbox("Ag")[1] + 6
+        line_height = _line_height(base_font, 6)
 
         current_x = x
 
@@ -1293,5 +1219,5 @@ class PillowCardGenerator(BaseCardGenerator):
             draw.text((current_x, y), token_text, font=font, fill=base_color)
 
             # Сдвиг позиции
-            bbox = font.getbbox(token_text)
+            bbox = _text_bbox(font, token_text)
             current_x += bbox[2] - bbox[0] + 4
@@ -72,17 +72,28 @@ class ApiGPT(AbstractGPT, metaclass=ABCMeta):
         timeout (int): Таймаут запроса в секундах
     """
 
-    def __init__(self, *, api_url: str, headers: Dict[str, str], timeout: int):
+    def __init__(
+            self,
+            *,
+            api_url: str,
+            headers: Dict[str, str],
+            timeout: int,
+            max_concurrent_requests: int,
+    ):
         """Инициализация API-клиента GPT.
 
         Args:
             api_url (str): Полный URL эндпоинта API
             headers (Dict[str, str]): HTTP-заголовки для авторизации
             timeout (int): Таймаут запроса в секундах
+            max_concurrent_requests (int): Максимальное количество одновременных запросов
         """
         self.api_url = api_url
         self.headers = headers
         self.timeout = timeout
+        # Ограничиваем параллельные запросы, чтобы при всплеске нагрузки
+        # запросы вставали в очередь, а не упирались в лимиты API
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
 
     @abstractmethod
     def build_payload(self, prompt: str, system_prompt: str) -> Dict:
@@ -119,7 +130,8 @@ class ApiGPT(AbstractGPT, metaclass=ABCMeta):
         logger.debug(f"Начало генерации для модели {self.model_name}")
         
         payload = self.build_payload(prompt, system_prompt)
-        response = await self._make_request(payload)
+        async with self._semaphore:
+            response = await self._make_request(payload)
         
         logger.info(f"Успешно получен ответ от модели {self.model_name}")
         return response
@@ -144,7 +156,9 @@ class ApiGPT(AbstractGPT, metaclass=ABCMeta):
         """
         try:
             logger.debug(f"Отправка запроса к {self.model_name}")
-            logger.debug(f"Размер payload: {len(json.dumps(payload))} символов")
+            if logger.isEnabledFor(logging.DEBUG):
+                # Сериализация payload нужна только для отладочной записи
+                logger.debug(f"Размер payload: {len(json.dumps(payload))} символов")
             
             async with aiohttp.ClientSession() as session:
                 async with session.post(
@@ -219,6 +233,7 @@ class YandexGPT(ApiGPT):
             api_url=config.YANDEXGPT_API_URL,
             headers=get_yandexgpt_headers(config.YANDEXGPT_API_KEY),
             timeout=config.YANDEXGPT_TIMEOUT,
+            max_concurrent_requests=config.YANDEXGPT_MAX_CONCURRENT_REQUESTS,
         )
         
         logger.debug(f"Инициализирован клиент {self.model_name}")
@@ -450,8 +450,7 @@ class FusionBrainImageGenerator(AbstractImageGenerator):
 
         prompt = "\n".join(sections).strip()
 
-        width = dimensions.width
-        height = dimensions.height
+        width, height = dimensions
         images = 1
 
         # Запускаем генерацию
@@ -7,15 +7,26 @@ import logging
 
 from aiogram import Bot, Dispatcher
 
+try:
+    import uvloop
+except ImportError:  # uvloop не установлен или недоступен (Windows)
+    uvloop = None
+
 from bootstrap import bootstrap
 from bot import bot, dispatcher
 from config import config
 
 # Конфигурация логгирования
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(
+    logging.Formatter("{asctime} - {name} - {levelname} - {message}", style="{")
 )
+logging.basicConfig(level=logging.INFO, handlers=[log_handler])
+
+# aiogram пишет INFO-запись на каждое обработанное обновление,
+# оставляем ее только в debug-режиме
+if not config.DEBUG:
+    logging.getLogger("aiogram.event").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +53,9 @@ if __name__ == "__main__":
 
     logger.info("Запускаю бота...")
     try:
-        asyncio.run(run_bot(bot, dispatcher))
+        # Если установлен uvloop, запускаем бота на его более быстром цикле событий
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        asyncio.run(run_bot(bot, dispatcher), loop_factory=loop_factory)
     except Exception as e:
         logger.exception(f"Ошибка при попытке запуска: {e}")
         raise
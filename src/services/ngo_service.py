@@ -4,6 +4,7 @@
 
 from typing import Optional, Tuple
 import logging
+import time
 
 from infrastructure.repositories.ngo_repository import AbstractNGORepository
 
@@ -12,7 +13,8 @@ from models import Ngo
 # Настройка логгера для модуля
 logger = logging.getLogger(__name__)
 
-
+# Время жизни закешированных данных НКО в секундах
+NGO_CACHE_TTL_SECONDS = 300
 
 
 class NGOService:
@@ -30,6 +32,8 @@ class NGOService:
             repository (AbstractNGORepository): Экземпляр репозитория для работы с БД
         """
         self.repository: AbstractNGORepository = repository
+        # Кеш данных НКО: user_id -> (время загрузки, данные)
+        self._ngo_cache: dict[int, tuple[float, Ngo]] = {}
         logger.debug("Инициализирован сервис работы с НКО")
 
     def get_ngo_data_by_user_id(self, user_id: int) -> Ngo:
@@ -39,18 +43,31 @@ class NGOService:
         и возвращает структурированный словарь с данными. Возвращает None
         если данные не найдены или произошла ошибка.
 
+        Результат кешируется на NGO_CACHE_TTL_SECONDS, чтобы повторные
+        генерации карточек не обращались к БД каждый раз.
+
         Args:
             user_id (int): Идентификатор пользователя в Telegram
 
         Returns:
             Ngo: Данные НКО
         """
+        cached = self._ngo_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < NGO_CACHE_TTL_SECONDS:
+            logger.debug(f"Данные НКО для пользователя {user_id} взяты из кеша")
+            return cached[1]
+
         logger.debug(f"Запрос данных НКО для пользователя {user_id}")
         ngo_data = self.repository.get_by_user_id(user_id)
+        self._ngo_cache[user_id] = (time.monotonic(), ngo_data)
 
         logger.info(f"Найдены данные НКО '{ngo_data.name}' для пользователя {user_id}")
         return ngo_data
 
+    def _invalidate_cache(self, user_id: int) -> None:
+        """Сбросить закешированные данные НКО пользователя."""
+        self._ngo_cache.pop(user_id, None)
+
     def create_ngo(self, ngo_data: Ngo) -> None:
         """Создать новые данные о НКО.
         
@@ -62,6 +79,7 @@ class NGOService:
         """
         logger.info(f"Создание новых данных НКО для пользователя {ngo_data.user_id}")
         self.repository.create(ngo_data)
+        self._invalidate_cache(ngo_data.user_id)
 
     def update_ngo(self, ngo_data: Ngo) -> None:
         """Обновить данные о НКО.
@@ -73,6 +91,7 @@ class NGOService:
         """
         logger.info(f"Обновление данных НКО для пользователя {ngo_data.user_id}")
         self.repository.update(ngo_data)
+        self._invalidate_cache(ngo_data.user_id)
 
     def delete_ngo(self, user_id: int) -> None:
         """Удалить данные о НКО пользователя.
@@ -81,6 +100,7 @@ class NGOService:
             user_id (int): Идентификатор пользователя в Telegram
         """
         logger.info(f"Даление данных НКО для пользователя {user_id}")
+        self._invalidate_cache(user_id)
         return self.repository.delete_by_user_id(user_id)
 
     def ngo_exists(self, user_id: int) -> bool:
@@ -92,6 +112,10 @@ class NGOService:
         Args:
             user_id (int): Идентификатор пользователя в Telegram
         """
+        cached = self._ngo_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < NGO_CACHE_TTL_SECONDS:
+            return True
+
         exists = self.repository.is_exists_by_user_id(user_id)
         logger.debug(f"Проверка существования НКО для пользователя {user_id}: {exists}")
         return exists